@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from mutagen.easyid3 import EasyID3
 
 import logging
 import mutagen
@@ -10,8 +11,11 @@ import pathlib
 
 logger = logging.getLogger(__name__)
 
+# Formats whose tags live in a leading ID3 block
+_ID3_EXTENSIONS = {".mp3"}
 
-@dataclass
+
+@dataclass(slots=True)
 class AudioMetadata:
     """Extracted metadata for a single audio file."""
 
@@ -50,11 +54,26 @@ def _get_tag(tags: mutagen.FileType, key: str) -> str | None:
     return None
 
 
+def _read_tags(path: pathlib.Path):
+    """Read the tags of an audio file.
+
+    For MP3 only the ID3 block is parsed; ``mutagen.File`` would also scan
+    the MPEG stream for length and bitrate, which are not needed here.
+    Files without an ID3 header fall back to ``mutagen.File``.
+    """
+    if path.suffix.lower() in _ID3_EXTENSIONS:
+        try:
+            return EasyID3(path)
+        except mutagen.MutagenError:
+            pass
+    return mutagen.File(path, easy=True)
+
+
 def extract_audio(path: pathlib.Path) -> AudioMetadata:
     """Extract metadata from a single audio file using mutagen."""
     meta = AudioMetadata(source_path=path)
     try:
-        tags = mutagen.File(path, easy=True)
+        tags = _read_tags(path)
     except Exception:
         logger.warning("Failed to read audio tags from %s", path.name, exc_info=True)
         return meta
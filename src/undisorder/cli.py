@@ -59,6 +59,7 @@ def build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Delete newer duplicates, keeping the oldest file in each group",
     )
+    p_dupes.set_defaults(func=cmd_dupes)
 
     # --- import ---
     p_import = sub.add_parser("import", help="Import files into collection")
@@ -133,9 +134,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Interactively select which directories to import",
     )
+    p_import.set_defaults(func=run_import)
     # --- hashdb ---
     p_hashdb = sub.add_parser("hashdb", help="Rebuild hash index for target")
     p_hashdb.add_argument("target", type=pathlib.Path, help="Target directory to index")
+    p_hashdb.set_defaults(func=cmd_hashdb)
 
     return parser
 
@@ -197,9 +200,8 @@ def cmd_dupes(args: argparse.Namespace) -> None:
 def cmd_hashdb(args: argparse.Namespace) -> None:
     """Rebuild the hash DB for a target directory."""
     logger.info(f"Rebuilding hash index for {args.target} ...")
-    db = HashDB(args.target)
-    count = db.rebuild(args.target)
-    db.close()
+    with HashDB(args.target) as db:
+        count = db.rebuild(args.target)
     logger.info(f"Indexed {count} file(s).")
 
 
@@ -221,14 +223,4 @@ def main() -> None:
         config = load_config()
         merge_config_into_args(args, config)
 
-    commands = {
-        "dupes": cmd_dupes,
-        "import": run_import,
-        "hashdb": cmd_hashdb,
-    }
-
-    cmd_func = commands.get(args.command)
-    if cmd_func:
-        cmd_func(args)
-    else:
-        parser.print_help()
+    args.func(args)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import pathlib
@@ -28,6 +29,30 @@ _PATH_KEYS = {"images_target", "video_target", "audio_target"}
 _BOOL_KEYS = {"dry_run", "move", "identify", "select"}
 _LIST_KEYS = {"exclude", "exclude_dir"}
 
+# Default target paths, expanded once
+_DEFAULT_PATHS: dict[str, pathlib.Path] = {
+    key: pathlib.Path(str(_DEFAULTS[key])).expanduser() for key in _PATH_KEYS
+}
+
+# Prompts of the configuration wizard: (key, label, default)
+_INTERACTIVE_SETTINGS: tuple[tuple[str, str, str], ...] = (
+    ("images_target", "Images target directory", str(_DEFAULTS["images_target"])),
+    ("video_target", "Video target directory", str(_DEFAULTS["video_target"])),
+    ("audio_target", "Audio target directory", str(_DEFAULTS["audio_target"])),
+    ("dry_run", "Dry run (true/false)", str(_DEFAULTS["dry_run"]).lower()),
+    ("move", "Move instead of copy (true/false)", str(_DEFAULTS["move"]).lower()),
+    (
+        "identify",
+        "AcoustID identification (true/false)",
+        str(_DEFAULTS["identify"]).lower(),
+    ),
+    (
+        "select",
+        "Interactive directory selection (true/false)",
+        str(_DEFAULTS["select"]).lower(),
+    ),
+)
+
 
 def config_dir() -> pathlib.Path:
     """Return the undisorder config directory.
@@ -47,6 +72,22 @@ def config_dir() -> pathlib.Path:
     return d
 
 
+def worker_count() -> int:
+    """Return the number of parallel workers to use.
+
+    Resolution order:
+    1. UNDISORDER_WORKERS (``1`` disables parallelism)
+    2. Number of CPUs, capped at 8
+    """
+    explicit = os.environ.get("UNDISORDER_WORKERS")
+    if explicit:
+        try:
+            return max(1, int(explicit))
+        except ValueError:
+            logger.warning(f"Ignoring invalid UNDISORDER_WORKERS value: {explicit}")
+    return min(os.cpu_count() or 1, 8)
+
+
 def load_config(cfg_dir: pathlib.Path | None = None) -> dict:
     """Load config.toml and return its contents as a dict.
 
@@ -68,35 +109,34 @@ def merge_config_into_args(args, config: dict) -> None:
 
     Mutates *args* in place.
     """
+    values = vars(args)
     for key in _PATH_KEYS:
-        cli_val = getattr(args, key, None)
-        if cli_val is not None:
+        if values.get(key) is not None:
             continue
         cfg_val = config.get(key)
         if cfg_val is not None:
-            setattr(args, key, pathlib.Path(cfg_val).expanduser())
+            values[key] = pathlib.Path(cfg_val).expanduser()
         else:
-            setattr(args, key, pathlib.Path(str(_DEFAULTS[key])).expanduser())
+            values[key] = _DEFAULT_PATHS[key]
 
     for key in _BOOL_KEYS:
-        cli_val = getattr(args, key, None)
-        if cli_val is not None:
+        if values.get(key) is not None:
             continue
         cfg_val = config.get(key)
         if cfg_val is not None:
-            setattr(args, key, bool(cfg_val))
+            values[key] = bool(cfg_val)
         else:
-            setattr(args, key, _DEFAULTS[key])
+            values[key] = _DEFAULTS[key]
 
     # List fields — merge CLI + config
     for key in _LIST_KEYS:
-        cli_val = getattr(args, key, None) or []
+        cli_val = values.get(key) or []
         cfg_val = config.get(key) or []
-        setattr(args, key, cli_val + [v for v in cfg_val if v not in cli_val])
+        values[key] = list(dict.fromkeys([*cli_val, *cfg_val]))
 
     # acoustid_key — CLI > config
-    if getattr(args, "acoustid_key", None) is None:
-        args.acoustid_key = config.get("acoustid_key")
+    if values.get("acoustid_key") is None:
+        values["acoustid_key"] = config.get("acoustid_key")
 
 
 def create_config_interactive(
@@ -114,27 +154,9 @@ def create_config_interactive(
 
     existing = load_config(cfg_dir)
 
-    settings: list[tuple[str, str, str]] = [
-        ("images_target", "Images target directory", str(_DEFAULTS["images_target"])),
-        ("video_target", "Video target directory", str(_DEFAULTS["video_target"])),
-        ("audio_target", "Audio target directory", str(_DEFAULTS["audio_target"])),
-        ("dry_run", "Dry run (true/false)", str(_DEFAULTS["dry_run"]).lower()),
-        ("move", "Move instead of copy (true/false)", str(_DEFAULTS["move"]).lower()),
-        (
-            "identify",
-            "AcoustID identification (true/false)",
-            str(_DEFAULTS["identify"]).lower(),
-        ),
-        (
-            "select",
-            "Interactive directory selection (true/false)",
-            str(_DEFAULTS["select"]).lower(),
-        ),
-    ]
-
     result: dict[str, object] = {}
 
-    for key, label, hardcoded_default in settings:
+    for key, label, hardcoded_default in _INTERACTIVE_SETTINGS:
         default = str(existing.get(key, hardcoded_default))
         value = input_fn(f"  {label} [{default}]: ").strip()
         if not value:
@@ -168,17 +190,26 @@ def create_config_interactive(
     return path
 
 
+def _toml_str(value: str) -> str:
+    """Quote *value* as a TOML basic string.
+
+    JSON string escapes are a subset of TOML's; DEL is the one control
+    character JSON leaves unescaped.
+    """
+    return json.dumps(value, ensure_ascii=False).replace("\x7f", "\\u007f")
+
+
 def _to_toml(data: dict) -> str:
     """Serialize a flat dict to TOML format."""
     lines: list[str] = []
     for key, value in data.items():
         if isinstance(value, bool):
-            lines.append(f"{key} = {str(value).lower()}")
+            lines.append(f"{key} = {'true' if value else 'false'}")
         elif isinstance(value, list):
-            items = ", ".join(f'"{v}"' for v in value)
+            items = ", ".join(map(_toml_str, value))
             lines.append(f"{key} = [{items}]")
         elif isinstance(value, str):
-            lines.append(f'{key} = "{value}"')
+            lines.append(f"{key} = {_toml_str(value)}")
         elif value is None:
             continue
         else:
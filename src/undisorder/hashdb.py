@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from collections.abc import Iterator
 from undisorder.config import config_dir
-from undisorder.hasher import hash_file
+from undisorder.hasher import hash_files
+from undisorder.scanner import walk_files
 
+import contextlib
 import datetime
 import logging
+import os
 import pathlib
 import sqlite3
 
@@ -14,6 +19,9 @@ logger = logging.getLogger(__name__)
 
 _SCHEMA_VERSION = 1
 
+# Host parameters per IN (...) query, well below SQLITE_MAX_VARIABLE_NUMBER
+_IN_CHUNK = 500
+
 _SCHEMA = """\
 CREATE TABLE IF NOT EXISTS files (
     original_hash TEXT PRIMARY KEY,
@@ -23,7 +31,8 @@ CREATE TABLE IF NOT EXISTS files (
     import_date   TEXT NOT NULL
 );
 CREATE INDEX IF NOT EXISTS idx_target ON files(target_dir);
-CREATE INDEX IF NOT EXISTS idx_file_path ON files(file_path, target_dir);
+-- No query looks files up by path; the index only slowed down inserts
+DROP INDEX IF EXISTS idx_file_path;
 CREATE TABLE IF NOT EXISTS acoustid_cache (
     file_hash TEXT PRIMARY KEY,
     fingerprint TEXT,
@@ -37,6 +46,22 @@ CREATE TABLE IF NOT EXISTS acoustid_cache (
     year INTEGER,
     lookup_date TEXT NOT NULL
 );
+CREATE TABLE IF NOT EXISTS hash_cache (
+    file_path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+"""
+
+
+# WAL avoids an fsync per commit and lets the photo and video connections read
+# while the other writes; NORMAL sync is still crash-safe in WAL mode.
+_PRAGMAS = """\
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA mmap_size = 268435456;
 """
 
 
@@ -48,8 +73,9 @@ def _default_db_path() -> pathlib.Path:
 class HashDB:
     """SQLite-backed hash index for a target directory.
 
-    Use as a context manager to get automatic commit on success and
-    rollback on exception::
+    Outside a ``with`` block every write method commits on its own.  Used
+    as a context manager, commits are deferred to the end of the block
+    (rollback on exception); ``flush()`` commits early::
 
         with HashDB(target) as db:
             db.insert(...)
@@ -65,6 +91,8 @@ class HashDB:
         self.db_path = db_path if db_path is not None else _default_db_path()
         self._conn = sqlite3.connect(self.db_path)
         self._conn.row_factory = sqlite3.Row
+        self._deferred = False
+        self._conn.executescript(_PRAGMAS)
         self._check_schema_version()
         self._conn.executescript(_SCHEMA)
 
@@ -89,10 +117,49 @@ class HashDB:
             pass
 
     def __enter__(self) -> HashDB:
+        self._deferred = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        self._conn.close()
+        try:
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+        finally:
+            self._deferred = False
+            self._conn.close()
+
+    def flush(self) -> None:
+        """Commit pending writes now."""
+        self._conn.commit()
+
+    def _commit(self) -> None:
+        """Commit, unless commits are deferred to the end of a ``with`` block."""
+        if not self._deferred:
+            self._conn.commit()
+
+    @contextlib.contextmanager
+    def _atomic(self) -> Iterator[None]:
+        """Run a group of writes atomically.
+
+        Commits at the end unless deferred; then a savepoint keeps a failing
+        group from discarding earlier pending writes.
+        """
+        if not self._deferred:
+            with self._conn:
+                yield
+            return
+        if not self._conn.in_transaction:
+            self._conn.execute("BEGIN")
+        self._conn.execute("SAVEPOINT atomic")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK TO atomic")
+            raise
+        finally:
+            self._conn.execute("RELEASE atomic")
 
     def insert(
         self,
@@ -112,7 +179,35 @@ class HashDB:
             "VALUES (?, ?, ?, ?, ?)",
             (original_hash, current_hash, self.target_dir, file_path, import_date),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_many(self, rows: list[tuple[str, str, str]]) -> None:
+        """Insert (original_hash, current_hash, file_path) rows in one transaction.
+
+        If a hash was recorded in the meantime (e.g. by another run), the rows
+        are inserted one by one instead, skipping the taken hashes, so that
+        one conflict does not drop the rows of the others.
+        """
+        import_date = datetime.datetime.now().isoformat()
+        sql = (
+            "INSERT INTO files (original_hash, current_hash, target_dir, file_path, import_date) "
+            "VALUES (?, ?, ?, ?, ?)"
+        )
+        values = [(o, c, self.target_dir, p, import_date) for o, c, p in rows]
+        try:
+            with self._atomic():
+                self._conn.executemany(sql, values)
+            return
+        except sqlite3.IntegrityError:
+            pass
+        with self._atomic():
+            for row in values:
+                try:
+                    self._conn.execute(sql, row)
+                except sqlite3.IntegrityError:
+                    logger.warning(
+                        "Skipping hash already recorded: %s (%s)", row[0][:12], row[3]
+                    )
 
     def hash_exists(self, file_hash: str) -> bool:
         """Check if original_hash exists globally (not scoped to target_dir).
@@ -126,6 +221,32 @@ class HashDB:
         )
         return cursor.fetchone() is not None
 
+    def _select_in(self, query: str, values: Iterable[str]) -> set[str]:
+        """Run ``query`` (ending in ``IN``) over *values* in chunks.
+
+        Returns the first column of all matching rows.
+        """
+        values = list(values)
+        found: set[str] = set()
+        for i in range(0, len(values), _IN_CHUNK):
+            chunk = values[i : i + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self._conn.execute(f"{query} ({placeholders})", chunk)
+            found.update(row[0] for row in cursor)
+        return found
+
+    def hashes_exist(self, hashes: Iterable[str]) -> set[str]:
+        """Return the subset of *hashes* present as original_hash (globally)."""
+        return self._select_in(
+            "SELECT original_hash FROM files WHERE original_hash IN", hashes
+        )
+
+    def acoustid_cached(self, file_hashes: Iterable[str]) -> set[str]:
+        """Return the subset of *file_hashes* with an AcoustID cache entry."""
+        return self._select_in(
+            "SELECT file_hash FROM acoustid_cache WHERE file_hash IN", file_hashes
+        )
+
     def get_acoustid_cache(self, file_hash: str) -> dict | None:
         """Get cached AcoustID lookup result for a file hash."""
         cursor = self._conn.execute(
@@ -163,7 +284,44 @@ class HashDB:
                 datetime.datetime.now().isoformat(),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def get_cached_hash(self, file_path: str, size: int, mtime_ns: int) -> str | None:
+        """Get the cached hash of a file, if size and mtime are unchanged."""
+        cursor = self._conn.execute(
+            "SELECT hash FROM hash_cache WHERE file_path = ? AND size = ? AND mtime_ns = ?",
+            (file_path, size, mtime_ns),
+        )
+        row = cursor.fetchone()
+        return row["hash"] if row else None
+
+    def store_cached_hashes(self, rows: list[tuple[str, int, int, str]]) -> None:
+        """Store (file_path, size, mtime_ns, hash) rows in the hash cache."""
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO hash_cache (file_path, size, mtime_ns, hash) "
+            "VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+
+    def forget_cached_hashes(self, file_paths: Iterable[str]) -> None:
+        """Drop hash cache rows for paths that no longer exist."""
+        self._conn.executemany(
+            "DELETE FROM hash_cache WHERE file_path = ?",
+            [(p,) for p in file_paths],
+        )
+        self._commit()
+
+    def _cached_paths_below(self, directory: pathlib.Path) -> set[str]:
+        """Return the hash cache paths below *directory*."""
+        prefix = os.path.join(os.path.abspath(directory), "")
+        # every path starting with prefix sorts between these two bounds
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        cursor = self._conn.execute(
+            "SELECT file_path FROM hash_cache WHERE file_path >= ? AND file_path < ?",
+            (prefix, upper),
+        )
+        return {row[0] for row in cursor}
 
     def rebuild(self, target_dir: pathlib.Path) -> int:
         """Incremental rebuild of the hash DB by scanning the target directory.
@@ -171,6 +329,7 @@ class HashDB:
         - Known file_path: update current_hash
         - Unknown file_path: insert with original_hash = current_hash = disk_hash
         - DB records with missing files: delete
+        - Hash cache rows for missing files below the target: delete
 
         Returns the number of files indexed.
         """
@@ -182,55 +341,80 @@ class HashDB:
         existing = {row["file_path"]: row["original_hash"] for row in cursor}
         seen_paths: set[str] = set()
 
-        count = 0
-        for path in sorted(target_dir.rglob("*")):
-            if not path.is_file():
-                continue
-            rel = path.relative_to(target_dir)
-            if any(part.startswith(".") for part in rel.parts):
-                continue
+        # Unchanged files (same size and mtime) reuse their cached hash; the
+        # rest is handed to worker threads while the walk continues, DB
+        # access stays on this thread
+        hashes: dict[pathlib.Path, str] = {}
+        misses: dict[pathlib.Path, tuple[str, int, int]] = {}
+        walked: set[str] = set()
 
-            rel_str = str(rel)
-            h = hash_file(path)
-            seen_paths.add(rel_str)
+        def scan() -> Iterator[pathlib.Path]:
+            for entry in walk_files(target_dir):
+                path = pathlib.Path(entry.path)
+                st = entry.stat()
+                key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+                walked.add(key[0])
+                cached = self.get_cached_hash(*key)
+                if cached is None:
+                    misses[path] = key
+                    yield path
+                else:
+                    hashes[path] = cached
 
+        hashes.update(hash_files(scan()))
+        self.store_cached_hashes([(*key, hashes[p]) for p, key in misses.items()])
+        self.forget_cached_hashes(self._cached_paths_below(target_dir) - walked)
+
+        # Sorted so that duplicate hashes resolve the same way on every run
+        paths = sorted(hashes)
+        updates: list[tuple[str, str, str]] = []
+        new_files: list[tuple[str, str]] = []
+        for path in paths:
+            h = hashes[path]
+            rel_str = str(path.relative_to(target_dir))
+            seen_paths.add(rel_str)
             if rel_str in existing:
                 # Known file — update current_hash
-                self._conn.execute(
-                    "UPDATE files SET current_hash = ? WHERE original_hash = ? AND target_dir = ?",
-                    (h, existing[rel_str], self.target_dir),
-                )
+                updates.append((h, existing[rel_str], self.target_dir))
             else:
                 # New file — insert with original_hash = current_hash
-                try:
-                    self._conn.execute(
-                        "INSERT INTO files (original_hash, current_hash, target_dir, file_path, import_date) "
-                        "VALUES (?, ?, ?, ?, ?)",
-                        (
-                            h,
-                            h,
-                            self.target_dir,
-                            rel_str,
-                            datetime.datetime.now().isoformat(),
-                        ),
-                    )
-                except sqlite3.IntegrityError:
-                    logger.warning(
-                        "Skipping duplicate hash during rebuild: %s (%s)", h[:12], rel
-                    )
-                    continue
-            count += 1
+                new_files.append((h, rel_str))
 
-        # Delete DB records with missing files
-        for file_path, orig_hash in existing.items():
-            if file_path not in seen_paths:
-                self._conn.execute(
-                    "DELETE FROM files WHERE original_hash = ? AND target_dir = ?",
-                    (orig_hash, self.target_dir),
+        # original_hash is the primary key; skip hashes already taken
+        taken = self.hashes_exist(h for h, _ in new_files)
+        import_date = datetime.datetime.now().isoformat()
+        inserts: list[tuple[str, str, str, str, str]] = []
+        for h, rel_str in new_files:
+            if h in taken:
+                logger.warning(
+                    "Skipping duplicate hash during rebuild: %s (%s)", h[:12], rel_str
                 )
+                continue
+            taken.add(h)
+            inserts.append((h, h, self.target_dir, rel_str, import_date))
 
-        self._conn.commit()
-        return count
+        # Delete DB records with missing files
+        deletes = [
+            (orig_hash, self.target_dir)
+            for file_path, orig_hash in existing.items()
+            if file_path not in seen_paths
+        ]
+
+        with self._atomic():
+            self._conn.executemany(
+                "UPDATE files SET current_hash = ? WHERE original_hash = ? AND target_dir = ?",
+                updates,
+            )
+            self._conn.executemany(
+                "INSERT INTO files (original_hash, current_hash, target_dir, file_path, import_date) "
+                "VALUES (?, ?, ?, ?, ?)",
+                inserts,
+            )
+            self._conn.executemany(
+                "DELETE FROM files WHERE original_hash = ? AND target_dir = ?",
+                deletes,
+            )
+        return len(updates) + len(inserts)
 
     def close(self) -> None:
         """Close the database connection."""
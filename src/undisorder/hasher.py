@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sized
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from undisorder.config import worker_count
 
 import hashlib
 import logging
+import mmap
+import os
 import pathlib
 
 logger = logging.getLogger(__name__)
@@ -21,31 +30,99 @@ class DuplicateGroup:
     paths: list[pathlib.Path]
 
 
-def hash_file(path: pathlib.Path, chunk_size: int = 8192) -> str:
-    """Compute SHA256 hash of a file."""
-    sha = hashlib.sha256()
+def _sha256(data: bytes | mmap.mmap = b"") -> hashlib._Hash:
+    """SHA256 for content identity, not security (allowed under FIPS builds)."""
+    return hashlib.sha256(data, usedforsecurity=False)
+
+
+# Files above this size are hashed through mmap instead of read().
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Read-ahead hint for mapped files (not available on all platforms)
+_MADV_SEQUENTIAL: int | None = getattr(mmap, "MADV_SEQUENTIAL", None)
+
+# Same-size files larger than this are first compared by a prefix hash.
+_PREFIX_SIZE = 64 * 1024
+
+
+def hash_file(path: pathlib.Path) -> str:
+    """Compute SHA256 hash of a file.
+
+    hashlib's SHA256 is OpenSSL's, which already uses SHA-NI / AVX2 where
+    the CPU offers it.  Files larger than ``_MMAP_THRESHOLD`` are mapped and
+    handed to the hasher directly; smaller ones go through
+    ``hashlib.file_digest``, which reads into one reusable buffer.
+    """
+    with path.open("rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > _MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if _MADV_SEQUENTIAL is not None:
+                        mm.madvise(_MADV_SEQUENTIAL)
+                    return _sha256(mm).hexdigest()
+            except (OSError, ValueError):
+                # e.g. special files or filesystems without mmap support
+                f.seek(0)
+        return hashlib.file_digest(f, _sha256).hexdigest()
+
+
+def _hash_prefix(path: pathlib.Path, n: int = _PREFIX_SIZE) -> str:
+    """Compute SHA256 of the first *n* bytes of a file."""
     with path.open("rb") as f:
-        while chunk := f.read(chunk_size):
-            sha.update(chunk)
-    return sha.hexdigest()
+        return _sha256(f.read(n)).hexdigest()
+
+
+def _map_concurrent(
+    func: Callable[[pathlib.Path], str], paths: Iterable[pathlib.Path]
+) -> Iterator[tuple[pathlib.Path, str]]:
+    """Apply *func* to *paths* on a thread pool, yielding results in order.
+
+    *paths* may be a lazy iterable; each path is submitted as soon as it is
+    produced, so producing the paths overlaps with the work on them.
+    """
+    workers = worker_count()
+    if isinstance(paths, Sized):
+        workers = min(workers, len(paths))
+    if workers < 2:
+        for p in paths:
+            yield p, func(p)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = [(p, ex.submit(func, p)) for p in paths]
+        for p, future in futures:
+            yield p, future.result()
+
+
+def hash_files(paths: Iterable[pathlib.Path]) -> Iterator[tuple[pathlib.Path, str]]:
+    """Hash *paths* concurrently, yielding ``(path, hash)`` in input order.
+
+    hashlib releases the GIL while digesting, so threads overlap both disk
+    reads and hashing.
+    """
+    return _map_concurrent(hash_file, paths)
 
 
 def find_duplicates(paths: list[pathlib.Path]) -> list[DuplicateGroup]:
     """Find duplicate files using 2-phase detection.
 
     Phase 1: Group files by size (cheap).
-    Phase 2: For same-size groups, compute SHA256 and group by hash.
+    Phase 1.5: Split same-size groups of large files by a prefix hash.
+    Phase 2: For remaining groups, compute SHA256 and group by hash.
     """
     if not paths:
         return []
 
-    # Phase 1: group by file size
-    size_groups: dict[int, list[pathlib.Path]] = defaultdict(list)
-    for p in paths:
-        size_groups[p.stat().st_size].append(p)
+    # Phase 1: group by file size; count first so that only sizes shared by
+    # two or more files get a group
+    sizes = [p.stat().st_size for p in paths]
+    counts = Counter(sizes)
+    candidates: dict[int, list[pathlib.Path]] = defaultdict(list)
+    for p, size in zip(paths, sizes):
+        if counts[size] >= 2:
+            candidates[size].append(p)
 
-    unique_by_size = sum(1 for g in size_groups.values() if len(g) < 2)
-    candidates = {s: g for s, g in size_groups.items() if len(g) >= 2}
+    unique_by_size = sum(1 for c in counts.values() if c < 2)
     files_to_hash = sum(len(g) for g in candidates.values())
     logger.debug(
         f"phase 1 (size grouping): {len(paths)} files -> "
@@ -53,16 +130,33 @@ def find_duplicates(paths: list[pathlib.Path]) -> list[DuplicateGroup]:
         f"{len(candidates)} size group(s) with {files_to_hash} files to hash"
     )
 
-    # Phase 2: hash only same-size groups
-    duplicates: list[DuplicateGroup] = []
-    hashed = 0
+    # Phase 1.5: split groups of large files by the hash of their first
+    # block; same-size media files mostly differ right there
+    large = [p for size, g in candidates.items() if size > _PREFIX_SIZE for p in g]
+    prefixes = dict(_map_concurrent(_hash_prefix, large))
+    prefix_groups: dict[tuple[int, str], list[pathlib.Path]] = defaultdict(list)
     for size, group in candidates.items():
-        logger.debug(f"hashing {len(group)} files of size {size}")
+        for p in group:
+            prefix_groups[(size, prefixes.get(p, ""))].append(p)
+    remaining = [(size, g) for (size, _), g in prefix_groups.items() if len(g) >= 2]
+    logger.debug(
+        f"phase 1.5 (prefix hash): {len(large)} large files prefix-hashed, "
+        f"{files_to_hash - sum(len(g) for _, g in remaining)} ruled out"
+    )
+
+    # Phase 2: hash the remaining candidates, all groups through one pool
+    hashes = dict(hash_files([p for _, g in remaining for p in g]))
+    duplicates: list[DuplicateGroup] = []
+    # per-file messages are formatted only when they are actually emitted
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for size, group in remaining:
+        if debug:
+            logger.debug(f"hashed {len(group)} files of size {size}")
         hash_groups: dict[str, list[pathlib.Path]] = defaultdict(list)
         for p in group:
-            h = hash_file(p)
-            hashed += 1
-            logger.debug(f"  {h[:12]}.. {p}")
+            h = hashes[p]
+            if debug:
+                logger.debug(f"  {h[:12]}.. {p}")
             hash_groups[h].append(p)
 
         for h, files in hash_groups.items():
@@ -70,6 +164,6 @@ def find_duplicates(paths: list[pathlib.Path]) -> list[DuplicateGroup]:
                 duplicates.append(DuplicateGroup(hash=h, file_size=size, paths=files))
 
     logger.debug(
-        f"phase 2 (hashing): {hashed} files hashed, {len(duplicates)} duplicate group(s)"
+        f"phase 2 (hashing): {len(hashes)} files hashed, {len(duplicates)} duplicate group(s)"
     )
     return duplicates
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import TextIO
 from undisorder.audio_metadata import AudioMetadata
 from undisorder.audio_metadata import extract_audio_batch
 from undisorder.audio_metadata import write_audio_tags
 from undisorder.config import config_dir
+from undisorder.config import worker_count
 from undisorder.hashdb import HashDB
 from undisorder.hasher import hash_file
+from undisorder.hasher import hash_files
+from undisorder.metadata import close_exiftool
 from undisorder.metadata import extract_batch
 from undisorder.metadata import Metadata
-from undisorder.musicbrainz import identify_audio
 from undisorder.organizer import determine_audio_target_path
 from undisorder.organizer import resolve_collision
 from undisorder.organizer import suggest_dirname
@@ -32,8 +37,85 @@ import shutil
 import sys
 import traceback
 
+if sys.platform == "linux":
+    import fcntl
+
 logger = logging.getLogger(__name__)
 
+# ioctl request to clone a file's extents (btrfs, XFS), see ioctl_ficlone(2)
+_FICLONE = 0x40049409
+
+# Concurrent AcoustID lookups; acoustid/musicbrainzngs rate-limit requests
+# themselves, more threads only overlap fingerprinting and round trips.
+_IDENTIFY_WORKERS = 4
+
+# Cached hashes, cache misses with their cache keys, and the hashing future
+_PendingHashes = tuple[
+    dict[pathlib.Path, str],
+    dict[pathlib.Path, tuple[str, int, int]],
+    Future[dict[pathlib.Path, str]],
+]
+
+
+# ---------------------------------------------------------------------------
+# Progress output
+# ---------------------------------------------------------------------------
+
+
+def _log_progress(i: int, total: int, f: pathlib.Path, suffix: str = "") -> None:
+    """Log a per-file progress line, without formatting it under ``--quiet``."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"  [{i}/{total}] {f.name}{suffix}")
+
+
+# ---------------------------------------------------------------------------
+# File operations
+# ---------------------------------------------------------------------------
+
+
+def _reflink(src: pathlib.Path, dst: pathlib.Path) -> bool:
+    """Clone *src* to the new file *dst* without copying data.
+
+    Returns False if the filesystem does not support cloning.
+    """
+    if sys.platform != "linux":
+        return False
+    with open(src, "rb") as fsrc:
+        try:
+            fdst = open(dst, "xb")
+        except FileExistsError:
+            return False
+        with fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                return True
+            except OSError:
+                pass
+    dst.unlink()
+    return False
+
+
+def _copy_file(src: pathlib.Path, dst: pathlib.Path) -> None:
+    """Copy *src* to *dst* with metadata, like ``shutil.copy2``.
+
+    On copy-on-write filesystems the file is cloned in constant time.
+    """
+    if _reflink(src, dst):
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+def _move_file(src: pathlib.Path, dst: pathlib.Path) -> None:
+    """Move *src* to *dst*, renaming in place on the same filesystem.
+
+    Falls back to ``shutil.move`` (copy and delete) across filesystems.
+    """
+    try:
+        os.rename(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
 
 # ---------------------------------------------------------------------------
 # Base importer
@@ -46,7 +128,7 @@ class BaseImporter:
     Subclasses override hooks for metadata extraction, target path logic,
     and optional pre/post-import steps.  The shared workflow is:
 
-        extract metadata → hash → dedup → (dry-run log | copy/move + db insert)
+        hash → dedup → extract metadata → (dry-run log | copy/move + db insert)
     """
 
     media_label: str = ""
@@ -56,6 +138,12 @@ class BaseImporter:
     def __init__(self, args: argparse.Namespace) -> None:
         self.args = args
         self._dbs: list[HashDB] = []
+        # Target directories already created during this run
+        self._made_dirs: set[pathlib.Path] = set()
+        # Names present in each target directory, listed on first use
+        self._dir_names: dict[pathlib.Path, set[str]] = {}
+        # Failure log, opened on the first failed batch
+        self._failures_fh: TextIO | None = None
 
     def __enter__(self) -> BaseImporter:
         self._open_dbs()
@@ -64,6 +152,9 @@ class BaseImporter:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         for db in self._dbs:
             db.close()
+        if self._failures_fh is not None:
+            self._failures_fh.close()
+            self._failures_fh = None
 
     # -- hooks for subclasses -----------------------------------------------
 
@@ -91,7 +182,15 @@ class BaseImporter:
         """Return the full target path (before collision resolution)."""
         raise NotImplementedError
 
-    def _pre_dedup(
+    def _prepare_batch(
+        self,
+        batch: list[pathlib.Path],
+        hashes: dict[pathlib.Path, str],
+        metadata_map: dict,
+    ) -> None:
+        """Hook called once per batch with the files to import.  Default: no-op."""
+
+    def _pre_import(
         self,
         f: pathlib.Path,
         i: int,
@@ -99,9 +198,9 @@ class BaseImporter:
         file_hash: str,
         metadata_map: dict,
     ) -> None:
-        """Hook called per-file before the dedup check.  Default: log progress."""
+        """Hook called per file that passed the dedup checks.  Default: log progress."""
         if not self.args.dry_run:
-            logger.info(f"  [{i}/{batch_len}] {f.name}")
+            _log_progress(i, batch_len, f)
 
     def _should_move(self, src_path: pathlib.Path) -> bool:
         """Whether to move (vs copy) *src_path*."""
@@ -122,15 +221,17 @@ class BaseImporter:
 
     # -- helpers ---------------------------------------------------------------
 
-    @staticmethod
     def _log_failure(
+        self,
         rel_dir: pathlib.PurePosixPath,
         media_type: str,
         batch: list[pathlib.Path],
         exc: Exception,
     ) -> None:
-        """Append a structured failure record to the import failures log."""
-        log_path = config_dir() / "import_failures.jsonl"
+        """Append a structured failure record to the import failures log.
+
+        The log stays open for the rest of the run; each record is flushed.
+        """
         entry = {
             "timestamp": datetime.datetime.now().isoformat(),
             "source_dir": str(rel_dir),
@@ -140,8 +241,10 @@ class BaseImporter:
             "error_message": str(exc),
             "traceback": traceback.format_exc(),
         }
-        with open(log_path, "a") as fh:
-            fh.write(json.dumps(entry) + "\n")
+        if self._failures_fh is None:
+            self._failures_fh = open(config_dir() / "import_failures.jsonl", "a")
+        self._failures_fh.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._failures_fh.flush()
 
     @staticmethod
     def _group_by_source_dir(
@@ -175,6 +278,89 @@ class BaseImporter:
                 batches.append((rel_dir, files[i : i + batch_size]))
         return batches
 
+    def _ensure_dir(self, path: pathlib.Path) -> None:
+        """Create *path* (and parents) once per run."""
+        if path not in self._made_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._made_dirs.add(path)
+
+    def _names_in(self, directory: pathlib.Path) -> set[str]:
+        """Return the names in *directory*, listing it once per run."""
+        names = self._dir_names.get(directory)
+        if names is None:
+            try:
+                names = set(os.listdir(directory))
+            except FileNotFoundError:
+                names = set()
+            self._dir_names[directory] = names
+        return names
+
+    def _transfer(self, src_path: pathlib.Path, target_path: pathlib.Path) -> None:
+        """Copy or move *src_path* to *target_path* (runs in a worker thread)."""
+        if self._should_move(src_path):
+            _move_file(src_path, target_path)
+        else:
+            _copy_file(src_path, target_path)
+
+    @staticmethod
+    def _hash_batch(batch: list[pathlib.Path]) -> dict[pathlib.Path, str]:
+        """Hash all files of a batch, reading several files concurrently."""
+        return dict(hash_files(batch))
+
+    def _start_hashing(
+        self,
+        batch: list[pathlib.Path],
+        executor: ThreadPoolExecutor,
+    ) -> _PendingHashes:
+        """Look up cached hashes for a batch and submit the misses to *executor*.
+
+        Hashes are cached per absolute source path and invalidated when size
+        or mtime differ.  The cache is global (not scoped to a target), so
+        any open DB connection serves it.  DB access stays on the calling
+        thread; only hashing runs in the executor.
+        """
+        db = self._dbs[0]
+        hashes: dict[pathlib.Path, str] = {}
+        misses: dict[pathlib.Path, tuple[str, int, int]] = {}
+        for f in batch:
+            st = f.stat()
+            key = (os.path.abspath(f), st.st_size, st.st_mtime_ns)
+            cached = db.get_cached_hash(*key)
+            if cached is None:
+                misses[f] = key
+            else:
+                hashes[f] = cached
+        future = executor.submit(self._hash_batch, list(misses))
+        return hashes, misses, future
+
+    def _finish_hashing(self, pending: _PendingHashes) -> dict[pathlib.Path, str]:
+        """Wait for submitted hashing and store new hashes in the cache."""
+        hashes, misses, future = pending
+        computed = future.result()
+        if misses:
+            self._dbs[0].store_cached_hashes(
+                [(*key, computed[f]) for f, key in misses.items()]
+            )
+            hashes.update(computed)
+        return hashes
+
+    def _prefetch_hashes(
+        self,
+        batch: list[pathlib.Path],
+        executor: ThreadPoolExecutor,
+    ) -> _PendingHashes | None:
+        """Start hashing the next batch; errors are left for its own turn."""
+        try:
+            return self._start_hashing(batch, executor)
+        except Exception:
+            # Retried (and reported) when the batch itself is processed
+            return None
+
+    def _cached_hashes(self, batch: list[pathlib.Path]) -> dict[pathlib.Path, str]:
+        """Return hashes for a batch, only hashing files changed since last seen."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return self._finish_hashing(self._start_hashing(batch, executor))
+
     # -- shared workflow ----------------------------------------------------
 
     def run(self, files: list[pathlib.Path]) -> int:
@@ -189,20 +375,30 @@ class BaseImporter:
 
         batches = self._iter_batches(dir_groups, batch_size=self.batch_size)
         total_batches = len(batches)
-        for batch_idx, (rel_dir, batch) in enumerate(batches, 1):
-            n = len(batch)
-            label = "file" if n == 1 else "files"
-            logger.info(
-                f"Processing {self.media_label} {batch_idx}/{total_batches}: {rel_dir}/ ({n} {label})"
-            )
-            try:
-                imported, skipped = self.import_batch(batch)
-                total_imported += imported
-                total_skipped += skipped
-            except Exception as exc:
-                logger.exception(f"Error importing {rel_dir}, skipping")
-                self._log_failure(rel_dir, self.failure_label, batch, exc)
-                total_failures += 1
+
+        # Pipeline: the next batch is hashed in the background while the
+        # current one is copied.
+        with ThreadPoolExecutor(max_workers=1) as prefetch:
+            pending: _PendingHashes | None = None
+            for batch_idx, (rel_dir, batch) in enumerate(batches, 1):
+                n = len(batch)
+                label = "file" if n == 1 else "files"
+                logger.info(
+                    f"Processing {self.media_label} {batch_idx}/{total_batches}: {rel_dir}/ ({n} {label})"
+                )
+                try:
+                    current = pending or self._start_hashing(batch, prefetch)
+                    pending = None
+                    hashes = self._finish_hashing(current)
+                    if batch_idx < total_batches:
+                        pending = self._prefetch_hashes(batches[batch_idx][1], prefetch)
+                    imported, skipped = self.import_batch(batch, hashes)
+                    total_imported += imported
+                    total_skipped += skipped
+                except Exception as exc:
+                    logger.exception(f"Error importing {rel_dir}, skipping")
+                    self._log_failure(rel_dir, self.failure_label, batch, exc)
+                    total_failures += 1
 
         if total_skipped:
             logger.info(
@@ -223,20 +419,40 @@ class BaseImporter:
 
         return total_failures
 
-    def import_batch(self, batch: list[pathlib.Path]) -> tuple[int, int]:
-        """Process one batch of files.  Returns (imported, skipped)."""
-        metadata_map = self._extract_metadata(batch)
+    def import_batch(
+        self,
+        batch: list[pathlib.Path],
+        hashes: dict[pathlib.Path, str] | None = None,
+    ) -> tuple[int, int]:
+        """Process one batch of files.  Returns (imported, skipped).
+
+        *hashes* may be precomputed by the pipeline in ``run``.  Metadata is
+        only extracted for files that survive the dedup checks.
+        """
+        if hashes is None:
+            hashes = self._cached_hashes(batch)
 
         imported = 0
         skipped = 0
-        to_import: list[tuple[pathlib.Path, str]] = []
+        survivors: list[tuple[int, pathlib.Path, str]] = []
+
+        queued: dict[str, pathlib.Path] = {}
+        # original_hash is global across targets, any connection answers
+        existing = self._dbs[0].hashes_exist(set(hashes.values()))
 
         for i, f in enumerate(batch, 1):
-            h = hash_file(f)
+            h = hashes[f]
 
-            self._pre_dedup(f, i, len(batch), h, metadata_map)
+            if h in queued:
+                # Same content earlier in this batch, not yet in the DB
+                skipped += 1
+                logger.info(
+                    f"  [{i}/{len(batch)}] {f.name} "
+                    f"(duplicate of {queued[h].name}, skipping)"
+                )
+                continue
 
-            if self._get_db(f).hash_exists(h):
+            if h in existing:
                 skipped += 1
                 if self.args.dry_run:
                     logger.info(
@@ -244,11 +460,21 @@ class BaseImporter:
                     )
                 continue
 
-            to_import.append((f, h))
+            queued[h] = f
+            survivors.append((i, f, h))
 
-        if not to_import:
+        if not survivors:
             return imported, skipped
 
+        files = [f for _, f, _ in survivors]
+        metadata_map = self._extract_metadata(files)
+        self._prepare_batch(files, hashes, metadata_map)
+
+        to_import: list[tuple[pathlib.Path, str]] = []
+        for i, f, h in survivors:
+            self._pre_import(f, i, len(batch), h, metadata_map)
+            to_import.append((f, h))
+
         if self.args.dry_run:
             grouped: dict[str, list[str]] = {}
             for src_path, file_hash in to_import:
@@ -267,29 +493,68 @@ class BaseImporter:
 
             imported = len(to_import)
         else:
+            # Targets are planned here, so collision resolution sees every
+            # name handed out; only the transfers run on the thread pool.
+            ops: list[
+                tuple[pathlib.Path, str, pathlib.Path, Metadata | AudioMetadata]
+            ] = []
             for src_path, file_hash in to_import:
                 meta = metadata_map.get(src_path, self._default_metadata(src_path))
                 target_path = self._determine_target_path(src_path, meta)
-                target_path = resolve_collision(target_path)
-
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                if self._should_move(src_path):
-                    shutil.move(str(src_path), str(target_path))
-                else:
-                    shutil.copy2(str(src_path), str(target_path))
-
-                current_hash = self._post_import(src_path, target_path, file_hash, meta)
-
-                target_base = self._get_target_base(src_path)
-                rel_path = target_path.relative_to(target_base)
-                self._get_db(src_path).insert(
-                    original_hash=file_hash,
-                    current_hash=current_hash,
-                    file_path=str(rel_path),
+                target_path = resolve_collision(
+                    target_path, self._names_in(target_path.parent)
                 )
-                imported += 1
-
-                self._post_move_cleanup(src_path)
+                self._ensure_dir(target_path.parent)
+                ops.append((src_path, file_hash, target_path, meta))
+
+            # DB rows are written in one transaction per DB after the loop.
+            # Rows for files already transferred are flushed even if another
+            # file fails, so the DB never misses a file present in the target.
+            pending: dict[HashDB, list[tuple[str, str, str]]] = {}
+            done: list[pathlib.Path] = []
+            error: Exception | None = None
+            workers = max(1, min(worker_count(), len(ops)))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = [
+                    ex.submit(self._transfer, src, dst) for src, _, dst, _ in ops
+                ]
+                try:
+                    for (src_path, file_hash, target_path, meta), future in zip(
+                        ops, futures
+                    ):
+                        if future.cancelled():
+                            continue
+                        try:
+                            future.result()
+                            current_hash = self._post_import(
+                                src_path, target_path, file_hash, meta
+                            )
+                        except Exception as exc:
+                            if error is None:
+                                error = exc
+                                for later in futures:
+                                    later.cancel()
+                            continue
+
+                        target_base = self._get_target_base(src_path)
+                        rel_path = target_path.relative_to(target_base)
+                        pending.setdefault(self._get_db(src_path), []).append(
+                            (file_hash, current_hash, str(rel_path))
+                        )
+                        done.append(src_path)
+                        imported += 1
+                finally:
+                    for db, rows in pending.items():
+                        db.insert_many(rows)
+                    for src_path in done:
+                        self._post_move_cleanup(src_path)
+                    if self.args.move:
+                        # moved sources are gone, their cached hashes with them
+                        self._dbs[0].forget_cached_hashes(
+                            os.path.abspath(p) for p in done
+                        )
+            if error is not None:
+                raise error
 
         return imported, skipped
 
@@ -306,6 +571,24 @@ class PhotoVideoImporter(BaseImporter):
     failure_label = "photo_video"
     batch_size = 100
 
+    def __init__(
+        self,
+        args: argparse.Namespace,
+        *,
+        videos: list[pathlib.Path] | None = None,
+    ) -> None:
+        super().__init__(args)
+        # Scan results already tell photos from videos; anything not seeded
+        # here is classified once on first use.
+        self._is_video: dict[pathlib.Path, bool] = dict.fromkeys(videos or (), True)
+
+    def _video(self, src_path: pathlib.Path) -> bool:
+        is_video = self._is_video.get(src_path)
+        if is_video is None:
+            is_video = classify(src_path) is FileType.VIDEO
+            self._is_video[src_path] = is_video
+        return is_video
+
     def _open_dbs(self) -> None:
         if not self.args.dry_run:
             self.args.images_target.mkdir(parents=True, exist_ok=True)
@@ -315,13 +598,11 @@ class PhotoVideoImporter(BaseImporter):
         self._dbs = [self._img_db, self._vid_db]
 
     def _get_db(self, src_path: pathlib.Path) -> HashDB:
-        return self._vid_db if classify(src_path) is FileType.VIDEO else self._img_db
+        return self._vid_db if self._video(src_path) else self._img_db
 
     def _get_target_base(self, src_path: pathlib.Path) -> pathlib.Path:
         return (
-            self.args.video_target
-            if classify(src_path) is FileType.VIDEO
-            else self.args.images_target
+            self.args.video_target if self._video(src_path) else self.args.images_target
         )
 
     def _extract_metadata(self, batch: list[pathlib.Path]) -> dict:
@@ -341,6 +622,38 @@ class PhotoVideoImporter(BaseImporter):
 # ---------------------------------------------------------------------------
 
 
+def identify_audio(
+    path: pathlib.Path,
+    existing_meta: AudioMetadata,
+    **kwargs,
+) -> AudioMetadata:
+    """Lazy front for ``musicbrainz.identify_audio``.
+
+    acoustid and musicbrainzngs pull in an HTTP stack; they are only
+    imported once ``--identify`` actually looks something up.
+    """
+    from undisorder.musicbrainz import identify_audio as _identify_audio
+
+    return _identify_audio(path, existing_meta, **kwargs)
+
+
+class _DeferredAcoustIDCache:
+    """Stand-in ``db`` for ``identify_audio`` on worker threads.
+
+    Reports every lookup as uncached and buffers cache writes, which the
+    importer stores afterwards on its own thread.
+    """
+
+    def __init__(self) -> None:
+        self.rows: list[dict] = []
+
+    def get_acoustid_cache(self, file_hash: str) -> dict | None:
+        return None
+
+    def store_acoustid_cache(self, **kwargs) -> None:
+        self.rows.append(kwargs)
+
+
 class AudioImporter(BaseImporter):
     """Importer for audio files with optional AcoustID identification."""
 
@@ -357,6 +670,8 @@ class AudioImporter(BaseImporter):
         super().__init__(args)
         self._acoustid_key = acoustid_key
         self._identified: set[pathlib.Path] = set()
+        self._lookups: dict[pathlib.Path, AudioMetadata] = {}
+        self._lookup_cached: set[pathlib.Path] = set()
 
     def _open_dbs(self) -> None:
         if not self.args.dry_run:
@@ -379,23 +694,74 @@ class AudioImporter(BaseImporter):
     def _determine_target_path(self, src_path: pathlib.Path, metadata) -> pathlib.Path:
         return determine_audio_target_path(metadata, self.args.audio_target)
 
-    def _pre_dedup(self, f, i, batch_len, file_hash, metadata_map) -> None:
-        if self._acoustid_key and f in metadata_map:
-            cached = self._aud_db.get_acoustid_cache(file_hash)
-            suffix = " \u2014 AcoustID (cached)" if cached else " \u2014 AcoustID ..."
-            logger.info(f"  [{i}/{batch_len}] {f.name}{suffix}")
-            original = metadata_map[f]
-            metadata_map[f] = identify_audio(
+    def _prepare_batch(self, batch, hashes, metadata_map) -> None:
+        """Identify the batch up front, running uncached lookups concurrently.
+
+        Cache hits are resolved on this thread.  Worker threads get a
+        ``_DeferredAcoustIDCache`` instead of the DB, and their cache rows are
+        written here once all lookups are done, so SQLite is only ever used
+        from the importing thread.
+        """
+        self._lookups = {}
+        self._lookup_cached = set()
+        if not self._acoustid_key:
+            return
+        todo: dict[str, pathlib.Path] = {}
+        for f in batch:
+            if f in metadata_map:
+                todo.setdefault(hashes[f], f)
+        cached = self._aud_db.acoustid_cached(todo)
+        misses: list[tuple[pathlib.Path, str]] = []
+        for h, f in todo.items():
+            if h not in cached:
+                misses.append((f, h))
+                continue
+            self._lookup_cached.add(f)
+            self._lookups[f] = identify_audio(
                 f,
-                original,
+                metadata_map[f],
                 api_key=self._acoustid_key,
-                file_hash=file_hash,
+                file_hash=h,
                 db=self._aud_db,
             )
+        if not misses:
+            return
+        deferred = _DeferredAcoustIDCache()
+
+        def lookup(item: tuple[pathlib.Path, str]) -> AudioMetadata:
+            f, h = item
+            return identify_audio(
+                f,
+                metadata_map[f],
+                api_key=self._acoustid_key,
+                file_hash=h,
+                db=deferred,
+            )
+
+        workers = min(_IDENTIFY_WORKERS, worker_count(), len(misses))
+        try:
+            if workers < 2:
+                results = [lookup(item) for item in misses]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as ex:
+                    results = list(ex.map(lookup, misses))
+        finally:
+            for row in deferred.rows:
+                self._aud_db.store_acoustid_cache(**row)
+        for (f, _), meta in zip(misses, results):
+            self._lookups[f] = meta
+
+    def _pre_import(self, f, i, batch_len, file_hash, metadata_map) -> None:
+        if self._acoustid_key and f in metadata_map:
+            cached = f in self._lookup_cached
+            suffix = " \u2014 AcoustID (cached)" if cached else " \u2014 AcoustID ..."
+            _log_progress(i, batch_len, f, suffix)
+            original = metadata_map[f]
+            metadata_map[f] = self._lookups[f]
             if metadata_map[f] is not original:
                 self._identified.add(f)
         elif not self.args.dry_run:
-            logger.info(f"  [{i}/{batch_len}] {f.name}")
+            _log_progress(i, batch_len, f)
 
     def _should_move(self, src_path: pathlib.Path) -> bool:
         return self.args.move and not self._acoustid_key
@@ -410,9 +776,13 @@ class AudioImporter(BaseImporter):
         if self.args.move and self._acoustid_key:
             src_path.unlink()
 
-    def import_batch(self, batch: list[pathlib.Path]) -> tuple[int, int]:
+    def import_batch(
+        self,
+        batch: list[pathlib.Path],
+        hashes: dict[pathlib.Path, str] | None = None,
+    ) -> tuple[int, int]:
         self._identified = set()
-        return super().import_batch(batch)
+        return super().import_batch(batch, hashes)
 
 
 # ---------------------------------------------------------------------------
@@ -430,7 +800,7 @@ def _import_photo_video(args: argparse.Namespace, result) -> int:
         f"Found {len(media_files)} photo/video files ({len(result.photos)} photos, {len(result.videos)} videos)"
     )
 
-    with PhotoVideoImporter(args) as importer:
+    with PhotoVideoImporter(args, videos=result.videos) as importer:
         return importer.run(media_files)
 
 
@@ -505,7 +875,10 @@ def run_import(args: argparse.Namespace) -> None:
 
     failures = 0
     if has_media:
-        failures += _import_photo_video(args, result)
+        try:
+            failures += _import_photo_video(args, result)
+        finally:
+            close_exiftool()
     if has_audio:
         failures += _import_audio(args, result)
 
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from undisorder.config import worker_count
 
+import contextlib
 import datetime
 import json
 import logging
+import os
 import pathlib
+import queue
+import re
 import subprocess
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Metadata:
     """Extracted metadata for a single file."""
 
@@ -32,22 +39,116 @@ _DATE_TAGS = [
     "XMP:CreateDate",
 ]
 
-_DATE_FORMAT = "%Y:%m:%d %H:%M:%S"
+# Same layout strptime("%Y:%m:%d %H:%M:%S") accepts, matched without its
+# per-call format parsing
+_DATE_RE = re.compile(r"(\d{4}):(\d{1,2}):(\d{1,2}) (\d{1,2}):(\d{1,2}):(\d{1,2})")
+
+
+class _ExifTool:
+    """A long-running ``exiftool -stay_open`` process.
+
+    Starting exiftool (a Perl program) takes far longer than reading one
+    batch of files, so processes are kept alive and reused across batches.
+    Arguments are passed one per line on stdin; each command is terminated
+    by ``-execute`` and its output by a ``{ready}`` line.
+    """
+
+    def __init__(self) -> None:
+        self._proc = subprocess.Popen(
+            ["exiftool", "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+            errors="surrogateescape",
+        )
+
+    def execute(self, args: list[str]) -> str:
+        """Run one command and return its stdout."""
+        stdin, stdout = self._proc.stdin, self._proc.stdout
+        assert stdin is not None and stdout is not None
+        stdin.write("".join(f"{arg}\n" for arg in [*args, "-execute"]))
+        stdin.flush()
+        lines: list[str] = []
+        for line in stdout:
+            if line.rstrip("\r\n") == "{ready}":
+                return "".join(lines)
+            lines.append(line)
+        raise OSError("exiftool exited unexpectedly")
+
+    def close(self) -> None:
+        """Ask exiftool to exit and wait for it."""
+        try:
+            assert self._proc.stdin is not None
+            self._proc.stdin.write("-stay_open\nFalse\n")
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        if self._proc.stdout is not None:
+            self._proc.stdout.close()
+
+
+# Idle exiftool processes.  extract_batch spreads each call over up to
+# worker_count() chunks running at once; each chunk takes an idle process or
+# starts a new one, so a run keeps at most that many processes alive.
+_idle_exiftools: queue.SimpleQueue[_ExifTool] = queue.SimpleQueue()
+
+
+def close_exiftool() -> None:
+    """Stop all idle exiftool processes started by ``extract_batch``."""
+    while True:
+        try:
+            tool = _idle_exiftools.get_nowait()
+        except queue.Empty:
+            return
+        tool.close()
+
+
+def _argfile_path(path: str) -> str:
+    """Encode *path* as a single exiftool argfile line.
+
+    Argfile lines are stripped of leading whitespace and skipped when they
+    start with ``#``, which an absolute path never does.  Line breaks can
+    only be passed in the ``#[CSTR]`` form, with C-style escapes.
+    """
+    if "\n" not in path and "\r" not in path:
+        return path
+    escaped = path.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "\\r")
+    return f"#[CSTR]{escaped}"
 
 
 def _run_exiftool(paths: list[pathlib.Path]) -> list[dict[str, object]]:
     """Run exiftool and return parsed JSON output."""
-    cmd = [
-        "exiftool",
+    try:
+        tool = _idle_exiftools.get_nowait()
+    except queue.Empty:
+        tool = _ExifTool()
+    # exiftool reports absolute paths back; map them to the given ones
+    sources = {os.path.abspath(p): str(p) for p in paths}
+    args = [
         "-json",
         "-n",  # numeric output (no conversion for GPS etc.)
         "-G",  # group names in tags
-        *[str(p) for p in paths],
+        *[_argfile_path(p) for p in sources],
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if not result.stdout.strip():
+    try:
+        output = tool.execute(args)
+    except BaseException:
+        tool.close()
+        raise
+    _idle_exiftools.put(tool)
+    if not output.strip():
         return []
-    return json.loads(result.stdout)
+    results = json.loads(output)
+    for raw in results:
+        source = str(raw.get("SourceFile", ""))
+        raw["SourceFile"] = sources.get(source, source)
+    return results
 
 
 def _parse_date(raw: dict[str, object]) -> datetime.datetime | None:
@@ -56,14 +157,18 @@ def _parse_date(raw: dict[str, object]) -> datetime.datetime | None:
         value = raw.get(tag)
         if not value or not isinstance(value, str):
             continue
+        match = _DATE_RE.fullmatch(value)
+        if match is None:
+            continue
         try:
-            dt = datetime.datetime.strptime(value, _DATE_FORMAT)
-            # Reject placeholder dates like 0000:00:00
-            if dt.year < 1900:
-                continue
-            return dt
+            year, month, day, hour, minute, second = map(int, match.groups())
+            dt = datetime.datetime(year, month, day, hour, minute, second)
         except ValueError:
             continue
+        # Reject placeholder dates like 0000:00:00
+        if dt.year < 1900:
+            continue
+        return dt
     return None
 
 
@@ -71,10 +176,14 @@ def _parse_one(raw: dict[str, object], path: pathlib.Path) -> Metadata:
     """Parse a single exiftool JSON result into a Metadata object."""
     date_taken = _parse_date(raw)
     date_from_mtime = False
-    if date_taken is None and path.exists():
-        mtime = path.stat().st_mtime
-        date_taken = datetime.datetime.fromtimestamp(mtime)
-        date_from_mtime = True
+    if date_taken is None:
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            pass
+        else:
+            date_taken = datetime.datetime.fromtimestamp(mtime)
+            date_from_mtime = True
     return Metadata(
         source_path=path,
         date_taken=date_taken,
@@ -85,16 +194,34 @@ def _parse_one(raw: dict[str, object], path: pathlib.Path) -> Metadata:
 def extract_batch(
     paths: list[pathlib.Path], batch_size: int = 100
 ) -> dict[pathlib.Path, Metadata]:
-    """Extract metadata from multiple files, calling exiftool in batches."""
+    """Extract metadata from multiple files, calling exiftool in batches.
+
+    The paths are spread evenly over up to ``worker_count()`` exiftool
+    processes running at once, in chunks of at most *batch_size* files; each
+    process does its own I/O and parsing, so threads only wait on them.
+    """
     if not paths:
         return {}
     out: dict[pathlib.Path, Metadata] = {}
     total = len(paths)
-    for i in range(0, total, batch_size):
-        chunk = paths[i : i + batch_size]
-        logger.info(f"Extracting metadata ... {min(i + batch_size, total)}/{total}")
-        results = _run_exiftool(chunk)
-        for raw in results:
-            source = pathlib.Path(str(raw.get("SourceFile", "")))
-            out[source] = _parse_one(raw, source)
+    workers = worker_count()
+    size = min(batch_size, -(-total // workers))
+    chunks = [paths[i : i + size] for i in range(0, total, size)]
+    workers = min(workers, len(chunks))
+    with contextlib.ExitStack() as stack:
+        outputs: Iterator[list[dict[str, object]]]
+        if workers < 2:
+            outputs = map(_run_exiftool, chunks)
+        else:
+            ex = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+            outputs = ex.map(_run_exiftool, chunks)
+        done = 0
+        for chunk, results in zip(chunks, outputs):
+            before, done = done, done + len(chunk)
+            # report progress every batch_size files, not for every chunk
+            if done == total or done // batch_size > before // batch_size:
+                logger.info(f"Extracting metadata ... {done}/{total}")
+            for raw in results:
+                source = pathlib.Path(str(raw.get("SourceFile", "")))
+                out[source] = _parse_one(raw, source)
     return out
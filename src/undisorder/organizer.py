@@ -5,6 +5,7 @@ from __future__ import annotations
 from undisorder.audio_metadata import AudioMetadata
 from undisorder.metadata import Metadata
 
+import functools
 import pathlib
 import re
 
@@ -74,13 +75,25 @@ def _get_meaningful_source_dir(
     returning the first meaningful directory name found. Stops at source_root.
     Without source_root, only checks the immediate parent (legacy behavior).
     """
+    return _meaningful_dir_of(source_path.parent, source_root)
+
+
+@functools.lru_cache(maxsize=4096)
+def _meaningful_dir_of(
+    parent: pathlib.Path,
+    source_root: pathlib.Path | None,
+) -> str | None:
+    """Cached walk for ``_get_meaningful_source_dir``.
+
+    Files of one source directory share the result, so the walk runs once
+    per directory instead of once per file.
+    """
     if source_root is None:
-        parent = source_path.parent.name
-        if is_meaningful_dirname(parent):
-            return parent
+        if is_meaningful_dirname(parent.name):
+            return parent.name
         return None
 
-    current = source_path.parent
+    current = parent
     while current != source_root and current != current.parent:
         if is_meaningful_dirname(current.name):
             return current.name
@@ -116,21 +129,30 @@ def suggest_dirname(meta: Metadata, *, source_root: pathlib.Path | None = None)
     return "unknown_date"
 
 
-def resolve_collision(target: pathlib.Path) -> pathlib.Path:
-    """Resolve filename collision by appending _1, _2, etc."""
-    if not target.exists():
-        return target
+def resolve_collision(
+    target: pathlib.Path, taken: set[str] | None = None
+) -> pathlib.Path:
+    """Resolve filename collision by appending _1, _2, etc.
+
+    *taken* optionally holds the names already present in the target
+    directory.  Candidates found there are skipped without touching the
+    filesystem, the first free one is still checked on disk, and the chosen
+    name is added to *taken*.
+    """
 
-    stem = target.stem
-    suffix = target.suffix
-    parent = target.parent
+    def is_free(candidate: pathlib.Path) -> bool:
+        if taken is not None and candidate.name in taken:
+            return False
+        return not candidate.exists()
 
+    result = target
     counter = 1
-    while True:
-        candidate = parent / f"{stem}_{counter}{suffix}"
-        if not candidate.exists():
-            return candidate
+    while not is_free(result):
+        result = target.parent / f"{target.stem}_{counter}{target.suffix}"
         counter += 1
+    if taken is not None:
+        taken.add(result.name)
+    return result
 
 
 def _sanitize_path_component(name: str) -> str:
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from dataclasses import field
 
 import enum
 import logging
+import os
 import pathlib
 
 logger = logging.getLogger(__name__)
@@ -114,6 +116,33 @@ def classify(path: pathlib.Path) -> FileType:
     return FileType.UNKNOWN
 
 
+def walk_files(root: pathlib.Path) -> Iterator[os.DirEntry[str]]:
+    """Yield files below *root*, skipping hidden files and directories.
+
+    Like ``rglob("*")`` this does not descend into symlinked directories, but
+    hidden directories are pruned instead of walked, and file type checks
+    use the information ``scandir`` already returned.  Directories that
+    cannot be read are logged and skipped, as ``rglob`` skips them.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError as e:
+            logger.warning(f"Cannot read {directory}: {e}")
+            continue
+        with it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    logger.debug(f"skip hidden: {entry.path}")
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(pathlib.Path(entry.path))
+                elif entry.is_file():
+                    yield entry
+
+
 def scan(directory: pathlib.Path) -> ScanResult:
     """Recursively scan a directory and classify all files.
 
@@ -123,19 +152,9 @@ def scan(directory: pathlib.Path) -> ScanResult:
         raise FileNotFoundError(f"Directory not found: {directory}")
 
     result = ScanResult()
-    skipped_hidden = 0
-    for path in sorted(directory.rglob("*")):
-        if not path.is_file():
-            continue
-        # Skip hidden files and files inside hidden directories
-        rel = path.relative_to(directory)
-        if any(part.startswith(".") for part in rel.parts):
-            skipped_hidden += 1
-            logger.debug(f"skip hidden: {rel}")
-            continue
-
+    for path in sorted(pathlib.Path(e.path) for e in walk_files(directory)):
         file_type = classify(path)
-        logger.debug(f"{file_type.value}: {rel}")
+        logger.debug(f"{file_type.value}: {path.relative_to(directory)}")
         if file_type is FileType.PHOTO:
             result.photos.append(path)
         elif file_type is FileType.VIDEO:
@@ -144,7 +163,4 @@ def scan(directory: pathlib.Path) -> ScanResult:
             result.audios.append(path)
         else:
             result.unknown.append(path)
-
-    if skipped_hidden:
-        logger.debug(f"skipped {skipped_hidden} hidden file(s)")
     return result
@@ -176,6 +176,29 @@ class TestExtractAudio:
             m = extract_audio(pathlib.Path("/fake/song.mp3"))
         assert m.year == 2024
 
+    def test_mp3_reads_id3_block_only(self, tmp_path):
+        """Tagged MP3 files are read via EasyID3 without mutagen.File."""
+        mp3_path = tmp_path / "song.mp3"
+        _create_mp3(mp3_path)
+        write_audio_tags(
+            mp3_path, AudioMetadata(source_path=mp3_path, artist="Fast Path")
+        )
+        with patch("undisorder.audio_metadata.mutagen.File") as mock_file:
+            m = extract_audio(mp3_path)
+        mock_file.assert_not_called()
+        assert m.artist == "Fast Path"
+
+    def test_mp3_without_id3_falls_back(self, tmp_path):
+        """MP3 files without an ID3 header fall back to mutagen.File."""
+        mp3_path = tmp_path / "song.mp3"
+        mp3_path.write_bytes(b"\xff\xfb\x90\x04" + b"\x00" * 413)
+        with patch(
+            "undisorder.audio_metadata.mutagen.File", return_value=None
+        ) as mock_file:
+            m = extract_audio(mp3_path)
+        mock_file.assert_called_once_with(mp3_path, easy=True)
+        assert m.artist is None
+
 
 class TestExtractAudioBatch:
     """Test batch audio metadata extraction."""
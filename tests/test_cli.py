@@ -3,6 +3,7 @@
 from undisorder.cli import build_parser
 from undisorder.cli import cmd_dupes
 from undisorder.cli import cmd_hashdb
+from undisorder.importer import run_import
 from unittest.mock import MagicMock
 
 import logging
@@ -81,6 +82,12 @@ class TestBuildParser:
         assert args.command == "hashdb"
         assert args.target == pathlib.Path("/tmp/target")
 
+    def test_subcommands_dispatch_to_handlers(self):
+        parser = build_parser()
+        assert parser.parse_args(["dupes", "/tmp/s"]).func is cmd_dupes
+        assert parser.parse_args(["import", "/tmp/s"]).func is run_import
+        assert parser.parse_args(["hashdb", "/tmp/t"]).func is cmd_hashdb
+
     def test_verbose_flag(self):
         parser = build_parser()
         args = parser.parse_args(["--verbose", "dupes", "/tmp/s"])
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from undisorder.config import _to_toml
 from undisorder.config import CONFIG_FILENAME
 from undisorder.config import create_config_interactive
 from undisorder.config import load_config
 from undisorder.config import merge_config_into_args
+from undisorder.config import worker_count
 
 import argparse
 import pathlib
+import tomllib
 
 
 class TestLoadConfig:
@@ -87,6 +90,28 @@ class TestLoadConfig:
         assert cfg["dry_run"] is True
 
 
+class TestWorkerCount:
+    """Test resolving the parallel worker count."""
+
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("UNDISORDER_WORKERS", "3")
+        assert worker_count() == 3
+
+    def test_env_clamped_to_one(self, monkeypatch):
+        monkeypatch.setenv("UNDISORDER_WORKERS", "0")
+        assert worker_count() == 1
+
+    def test_invalid_env_falls_back_to_cpu_count(self, monkeypatch):
+        monkeypatch.setenv("UNDISORDER_WORKERS", "many")
+        monkeypatch.setattr("undisorder.config.os.cpu_count", lambda: 4)
+        assert worker_count() == 4
+
+    def test_default_capped(self, monkeypatch):
+        monkeypatch.delenv("UNDISORDER_WORKERS", raising=False)
+        monkeypatch.setattr("undisorder.config.os.cpu_count", lambda: 64)
+        assert worker_count() == 8
+
+
 class TestMergeConfigIntoArgs:
     """Test merging config into argparse Namespace."""
 
@@ -146,6 +171,11 @@ class TestMergeConfigIntoArgs:
         assert "*.wav" in args.exclude
         assert "*.aiff" in args.exclude
 
+    def test_exclude_lists_merged_without_duplicates(self):
+        args = self._make_args(exclude=["*.wav", "*.mp3"])
+        merge_config_into_args(args, {"exclude": ["*.aiff", "*.wav"]})
+        assert args.exclude == ["*.wav", "*.mp3", "*.aiff"]
+
     def test_exclude_empty_cli_uses_config(self):
         args = self._make_args()
         merge_config_into_args(args, {"exclude": ["*.aiff", "*.wav"]})
@@ -251,3 +281,23 @@ class TestCreateConfigInteractive:
         cfg = load_config(tmp_path)
         assert cfg["images_target"] == "/existing/photos"
         assert cfg["acoustid_key"] == "old-key"
+
+
+class TestToToml:
+    """Test the minimal TOML writer."""
+
+    def test_round_trip(self):
+        data = {
+            "images_target": "~/Bilder/Fotos",
+            "move": True,
+            "dry_run": False,
+            "exclude": ["*.wav", 'odd "name"', "back\\slash", "Über\x7f"],
+            "exclude_dir": [],
+            "acoustid_key": None,
+        }
+        parsed = tomllib.loads(_to_toml(data))
+        del data["acoustid_key"]
+        assert parsed == data
+
+    def test_empty(self):
+        assert _to_toml({}) == ""
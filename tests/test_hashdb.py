@@ -1,8 +1,11 @@
 """Tests for undisorder.hashdb — SQLite hash index CRUD."""
 
+from undisorder import hasher
 from undisorder.hashdb import _SCHEMA_VERSION
 from undisorder.hashdb import HashDB
+from unittest.mock import patch
 
+import os
 import pathlib
 import pytest
 import sqlite3
@@ -59,6 +62,74 @@ class TestHashDBInit:
         db2 = HashDB(tmp_target, db_path=db_path)
         assert db2.hash_exists("h1")
 
+    def test_drops_unused_file_path_index(
+        self, tmp_path: pathlib.Path, tmp_target: pathlib.Path
+    ):
+        db_path = tmp_path / "test.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE files (original_hash TEXT PRIMARY KEY, current_hash TEXT, "
+            "target_dir TEXT, file_path TEXT, import_date TEXT)"
+        )
+        conn.execute("CREATE INDEX idx_file_path ON files(file_path, target_dir)")
+        conn.commit()
+        conn.close()
+
+        db = HashDB(tmp_target, db_path=db_path)
+        names = {
+            r[0]
+            for r in db._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index'"
+            )
+        }
+        assert "idx_file_path" not in names
+        assert "idx_target" in names
+
+    def test_uses_wal_journal(self, db: HashDB):
+        assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert db._conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_context_manager_defers_commit(
+        self, tmp_path: pathlib.Path, tmp_target: pathlib.Path
+    ):
+        db_path = tmp_path / "test.db"
+        reader = HashDB(tmp_target, db_path=db_path)
+        with HashDB(tmp_target, db_path=db_path) as db:
+            db.insert(original_hash="h1", file_path="a.jpg")
+            db.store_cached_hashes([("/src/a.jpg", 1, 2, "h1")])
+            assert not reader.hash_exists("h1")
+            db.flush()
+            assert reader.hash_exists("h1")
+            db.insert_many([("h2", "h2", "b.jpg")])
+            assert not reader.hash_exists("h2")
+        assert reader.hash_exists("h2")
+        assert reader.get_cached_hash("/src/a.jpg", 1, 2) == "h1"
+
+    def test_context_manager_rolls_back_on_error(
+        self, tmp_path: pathlib.Path, tmp_target: pathlib.Path
+    ):
+        db_path = tmp_path / "test.db"
+        with pytest.raises(RuntimeError):
+            with HashDB(tmp_target, db_path=db_path) as db:
+                db.insert(original_hash="h1", file_path="a.jpg")
+                raise RuntimeError("boom")
+        with HashDB(tmp_target, db_path=db_path) as db:
+            assert not db.hash_exists("h1")
+
+    def test_conflicting_insert_many_keeps_pending_writes(
+        self, tmp_path: pathlib.Path, tmp_target: pathlib.Path
+    ):
+        db_path = tmp_path / "test.db"
+        with HashDB(tmp_target, db_path=db_path) as db:
+            db.insert(original_hash="h1", file_path="a.jpg")
+            db.insert_many([("h2", "h2", "b.jpg"), ("h1", "h1", "c.jpg")])
+        with HashDB(tmp_target, db_path=db_path) as db:
+            assert db.hashes_exist(["h1", "h2"]) == {"h1", "h2"}
+            row = db._conn.execute(
+                "SELECT file_path FROM files WHERE original_hash = ?", ("h1",)
+            ).fetchone()
+            assert row[0] == "a.jpg"
+
     def test_fresh_db_gets_schema_version(
         self, tmp_path: pathlib.Path, tmp_target: pathlib.Path
     ):
@@ -117,6 +188,36 @@ class TestHashDBInsert:
         with pytest.raises(sqlite3.IntegrityError):
             db.insert(original_hash="abc", file_path="b/photo.jpg")
 
+    def test_insert_many(self, db: HashDB):
+        db.insert_many([("abc", "abc", "a/photo.jpg"), ("def", "xyz", "b/photo.jpg")])
+        assert db.hash_exists("abc")
+        assert db.hash_exists("def")
+        row = db._conn.execute(
+            "SELECT current_hash FROM files WHERE original_hash = ?", ("def",)
+        ).fetchone()
+        assert row[0] == "xyz"
+
+    def test_hashes_exist(self, db: HashDB):
+        db.insert_many([("abc", "abc", "a.jpg"), ("def", "def", "b.jpg")])
+        assert db.hashes_exist(["abc", "xyz", "def"]) == {"abc", "def"}
+        assert db.hashes_exist([]) == set()
+
+    def test_hashes_exist_chunks_large_input(self, db: HashDB):
+        db.insert(original_hash="h0042", file_path="a.jpg")
+        candidates = [f"h{i:04d}" for i in range(1200)]
+        assert db.hashes_exist(candidates) == {"h0042"}
+
+    def test_insert_many_skips_recorded_hashes(self, db: HashDB, caplog):
+        """A hash recorded meanwhile does not drop the other rows."""
+        db.insert(original_hash="abc", file_path="other/photo.jpg")
+        db.insert_many([("def", "def", "a.jpg"), ("abc", "abc", "b.jpg")])
+        assert db.hash_exists("def")
+        row = db._conn.execute(
+            "SELECT file_path FROM files WHERE original_hash = ?", ("abc",)
+        ).fetchone()
+        assert row[0] == "other/photo.jpg"
+        assert "Skipping hash already recorded" in caplog.text
+
 
 class TestHashDBRebuild:
     """Test rebuilding the hash DB from the filesystem."""
@@ -177,10 +278,107 @@ class TestHashDBRebuild:
         h = hash_file(photo)
         assert db.hash_exists(h)
 
+    def test_rebuild_reuses_hashes_of_unchanged_files(
+        self, tmp_path: pathlib.Path, tmp_target: pathlib.Path
+    ):
+        """A second rebuild only hashes files whose size or mtime changed."""
+        (tmp_target / "a.jpg").write_bytes(b"content a")
+        changed = tmp_target / "b.jpg"
+        changed.write_bytes(b"content b")
+
+        db = HashDB(tmp_target, db_path=tmp_path / "test.db")
+        db.rebuild(tmp_target)
+        changed.write_bytes(b"content b, edited")
+
+        with patch("undisorder.hasher.hash_file", wraps=hasher.hash_file) as mock_hash:
+            assert db.rebuild(tmp_target) == 2
+        mock_hash.assert_called_once_with(changed)
+
+    def test_rebuild_skips_hidden_entries(
+        self, tmp_path: pathlib.Path, tmp_target: pathlib.Path
+    ):
+        """Hidden files and everything below hidden directories are ignored."""
+        (tmp_target / "2024" / "trip").mkdir(parents=True)
+        (tmp_target / "2024" / "trip" / "a.jpg").write_bytes(b"visible")
+        (tmp_target / ".thumbs").mkdir()
+        (tmp_target / ".thumbs" / "a.jpg").write_bytes(b"thumbnail")
+        (tmp_target / "2024" / ".DS_Store").write_bytes(b"junk")
+
+        db = HashDB(tmp_target, db_path=tmp_path / "test.db")
+        assert db.rebuild(tmp_target) == 1
+        rows = db._conn.execute("SELECT file_path FROM files").fetchall()
+        assert [r[0] for r in rows] == ["2024/trip/a.jpg"]
+
+    def test_rebuild_skips_duplicate_content(
+        self, tmp_path: pathlib.Path, tmp_target: pathlib.Path, caplog
+    ):
+        """Two files with the same content: only the first one is indexed."""
+        (tmp_target / "a.jpg").write_bytes(b"same content")
+        (tmp_target / "b.jpg").write_bytes(b"same content")
+        (tmp_target / "c.jpg").write_bytes(b"other content")
+
+        db = HashDB(tmp_target, db_path=tmp_path / "test.db")
+        count = db.rebuild(tmp_target)
+
+        assert count == 2
+        assert "Skipping duplicate hash during rebuild" in caplog.text
+        rows = db._conn.execute("SELECT file_path FROM files").fetchall()
+        assert sorted(r[0] for r in rows) == ["a.jpg", "c.jpg"]
+
+    def test_rebuild_forgets_cached_hashes_of_missing_files(
+        self, tmp_path: pathlib.Path, tmp_target: pathlib.Path
+    ):
+        kept = tmp_target / "a.jpg"
+        kept.write_bytes(b"kept")
+        gone = tmp_target / "b.jpg"
+        gone.write_bytes(b"gone")
+        outside = str(tmp_path / "target2" / "c.jpg")
+
+        db = HashDB(tmp_target, db_path=tmp_path / "test.db")
+        db.rebuild(tmp_target)
+        db.store_cached_hashes([(outside, 1, 1, "other")])
+        gone.unlink()
+        db.rebuild(tmp_target)
+
+        rows = db._conn.execute("SELECT file_path FROM hash_cache").fetchall()
+        assert sorted(r[0] for r in rows) == sorted([str(kept), outside])
+
+    def test_rebuild_skips_unreadable_directories(
+        self, tmp_path: pathlib.Path, tmp_target: pathlib.Path
+    ):
+        locked = tmp_target / "lost+found"
+        locked.mkdir()
+        (locked / "a.jpg").write_bytes(b"locked")
+        (tmp_target / "b.jpg").write_bytes(b"readable")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if pathlib.Path(path) == locked:
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        db = HashDB(tmp_target, db_path=tmp_path / "test.db")
+        with patch("os.scandir", side_effect=scandir):
+            assert db.rebuild(tmp_target) == 1
+        rows = db._conn.execute("SELECT file_path FROM files").fetchall()
+        assert [r[0] for r in rows] == ["b.jpg"]
+
 
 class TestAcoustidCache:
     """Test the acoustid_cache table for caching AcoustID lookups."""
 
+    def test_acoustid_cached(self, db: HashDB):
+        """Bulk existence check returns only hashes with a cache entry."""
+        db.store_acoustid_cache(
+            file_hash="abc123",
+            fingerprint="FP",
+            duration=1.0,
+            recording_id=None,
+            metadata={},
+        )
+        assert db.acoustid_cached(["abc123", "missing"]) == {"abc123"}
+        assert db.acoustid_cached([]) == set()
+
     def test_store_and_get(self, db: HashDB):
         """Store a cache entry and retrieve it."""
         db.store_acoustid_cache(
@@ -280,3 +478,33 @@ class TestAcoustidCache:
         )
         assert cursor.fetchone() is not None
         conn.close()
+
+
+class TestHashCache:
+    """Test the source-path hash cache."""
+
+    def test_store_and_get(self, db: HashDB):
+        db.store_cached_hashes([("/src/a.jpg", 100, 123456789, "abc123")])
+        assert db.get_cached_hash("/src/a.jpg", 100, 123456789) == "abc123"
+
+    def test_get_missing_returns_none(self, db: HashDB):
+        assert db.get_cached_hash("/src/a.jpg", 100, 123456789) is None
+
+    def test_changed_size_or_mtime_misses(self, db: HashDB):
+        db.store_cached_hashes([("/src/a.jpg", 100, 123456789, "abc123")])
+        assert db.get_cached_hash("/src/a.jpg", 101, 123456789) is None
+        assert db.get_cached_hash("/src/a.jpg", 100, 123456790) is None
+
+    def test_forget(self, db: HashDB):
+        db.store_cached_hashes(
+            [("/src/a.jpg", 100, 1, "abc"), ("/src/b.jpg", 100, 1, "def")]
+        )
+        db.forget_cached_hashes(["/src/a.jpg"])
+        assert db.get_cached_hash("/src/a.jpg", 100, 1) is None
+        assert db.get_cached_hash("/src/b.jpg", 100, 1) == "def"
+
+    def test_store_overwrites(self, db: HashDB):
+        db.store_cached_hashes([("/src/a.jpg", 100, 1, "old")])
+        db.store_cached_hashes([("/src/a.jpg", 200, 2, "new")])
+        assert db.get_cached_hash("/src/a.jpg", 100, 1) is None
+        assert db.get_cached_hash("/src/a.jpg", 200, 2) == "new"
@@ -2,9 +2,14 @@
 
 from undisorder.hasher import find_duplicates
 from undisorder.hasher import hash_file
+from undisorder.hasher import hash_files
+from unittest.mock import patch
 
+import hashlib
+import mmap
 import pathlib
 import pytest
+import threading
 
 
 class TestHashFile:
@@ -36,11 +41,97 @@ class TestHashFile:
         assert len(h) == 64  # SHA256 hex digest is 64 chars
         assert all(c in "0123456789abcdef" for c in h)
 
+    def test_content_spanning_several_reads(self, tmp_path: pathlib.Path):
+        data = b"x" * (700 * 1024 + 17)
+        f = tmp_path / "mid.bin"
+        f.write_bytes(data)
+        assert hash_file(f) == hashlib.sha256(data).hexdigest()
+
+    def test_large_file_uses_mmap(self, tmp_path: pathlib.Path):
+        data = b"y" * (2 * 1024 * 1024)
+        f = tmp_path / "big.bin"
+        f.write_bytes(data)
+        with patch("undisorder.hasher.mmap.mmap", wraps=mmap.mmap) as mm:
+            assert hash_file(f) == hashlib.sha256(data).hexdigest()
+        mm.assert_called_once()
+
+    def test_large_file_advises_sequential_read(self, tmp_path: pathlib.Path):
+        f = tmp_path / "big.bin"
+        f.write_bytes(b"y" * (2 * 1024 * 1024))
+        with patch("undisorder.hasher.mmap.mmap") as mock_mmap:
+            mm = mock_mmap.return_value.__enter__.return_value
+            with patch("undisorder.hasher._sha256") as mock_sha:
+                hash_file(f)
+        mock_sha.assert_called_once_with(mm)
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise.assert_called_once_with(mmap.MADV_SEQUENTIAL)
+
+    def test_small_file_skips_mmap(self, tmp_path: pathlib.Path):
+        f = tmp_path / "a.bin"
+        f.write_bytes(b"small")
+        with patch("undisorder.hasher.mmap.mmap") as mm:
+            assert hash_file(f) == hashlib.sha256(b"small").hexdigest()
+        mm.assert_not_called()
+
+    def test_mmap_failure_falls_back_to_read(self, tmp_path: pathlib.Path):
+        data = b"z" * (2 * 1024 * 1024)
+        f = tmp_path / "big.bin"
+        f.write_bytes(data)
+        with patch("undisorder.hasher.mmap.mmap", side_effect=OSError("nope")):
+            assert hash_file(f) == hashlib.sha256(data).hexdigest()
+
     def test_nonexistent_file_raises(self, tmp_path: pathlib.Path):
         with pytest.raises(FileNotFoundError):
             hash_file(tmp_path / "nope.bin")
 
 
+class TestHashFiles:
+    """Test concurrent hashing of several files."""
+
+    def test_results_in_input_order(self, tmp_path: pathlib.Path, monkeypatch):
+        monkeypatch.setenv("UNDISORDER_WORKERS", "4")
+        files = []
+        for i in range(10):
+            f = tmp_path / f"{i}.bin"
+            f.write_bytes(f"content {i}".encode())
+            files.append(f)
+        assert list(hash_files(files)) == [(f, hash_file(f)) for f in files]
+
+    def test_single_worker_sequential(self, tmp_path: pathlib.Path, monkeypatch):
+        monkeypatch.setenv("UNDISORDER_WORKERS", "1")
+        f = tmp_path / "a.bin"
+        f.write_bytes(b"a")
+        with patch("undisorder.hasher.ThreadPoolExecutor") as mock_pool:
+            assert list(hash_files([f])) == [(f, hash_file(f))]
+        mock_pool.assert_not_called()
+
+    def test_empty(self):
+        assert list(hash_files([])) == []
+
+    def test_lazy_paths_hashed_while_produced(
+        self, tmp_path: pathlib.Path, monkeypatch
+    ):
+        monkeypatch.setenv("UNDISORDER_WORKERS", "2")
+        f1 = tmp_path / "a.bin"
+        f2 = tmp_path / "b.bin"
+        f1.write_bytes(b"a")
+        f2.write_bytes(b"b")
+        started = threading.Event()
+
+        def fake_hash(path: pathlib.Path) -> str:
+            started.set()
+            return path.name
+
+        def produce():
+            yield f1
+            # the first file is already being hashed before the second exists
+            assert started.wait(5)
+            yield f2
+
+        with patch("undisorder.hasher.hash_file", side_effect=fake_hash):
+            assert list(hash_files(produce())) == [(f1, "a.bin"), (f2, "b.bin")]
+
+
 class TestFindDuplicates:
     """Test 2-phase duplicate detection."""
 
@@ -120,3 +211,44 @@ class TestFindDuplicates:
         f = tmp_path / "only.jpg"
         f.write_bytes(b"alone")
         assert find_duplicates([f]) == []
+
+    def test_large_files_with_different_prefix_not_fully_hashed(
+        self, tmp_path: pathlib.Path
+    ):
+        size = 200 * 1024
+        f1 = tmp_path / "a.mov"
+        f2 = tmp_path / "b.mov"
+        f1.write_bytes(b"A" * size)
+        f2.write_bytes(b"B" * size)
+        with patch("undisorder.hasher.hash_file") as mock_hash:
+            assert find_duplicates([f1, f2]) == []
+        mock_hash.assert_not_called()
+
+    def test_large_files_with_same_prefix_compared_in_full(
+        self, tmp_path: pathlib.Path
+    ):
+        head = b"H" * (100 * 1024)
+        f1 = tmp_path / "a.mov"
+        f2 = tmp_path / "b.mov"
+        f3 = tmp_path / "c.mov"
+        f1.write_bytes(head + b"tail one")
+        f2.write_bytes(head + b"tail two")
+        f3.write_bytes(head + b"tail one")
+        groups = find_duplicates([f1, f2, f3])
+        assert len(groups) == 1
+        assert set(groups[0].paths) == {f1, f3}
+
+    def test_per_file_debug_skipped_when_disabled(self, tmp_path: pathlib.Path):
+        files = []
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            f = tmp_path / name
+            f.write_bytes(b"same content")
+            files.append(f)
+        with (
+            patch("undisorder.hasher.logger.isEnabledFor", return_value=False),
+            patch("undisorder.hasher.logger.debug") as mock_debug,
+        ):
+            groups = find_duplicates(files)
+        assert len(groups) == 1
+        # only the three phase summaries, no per-group or per-file lines
+        assert mock_debug.call_count == 3
@@ -3,13 +3,19 @@
 from undisorder.audio_metadata import AudioMetadata
 from undisorder.importer import BaseImporter
 from undisorder.importer import run_import
+from undisorder.scanner import classify
 from unittest.mock import MagicMock
 from unittest.mock import patch
+from unittest.mock import PropertyMock
 
 import json
 import logging
 import os
 import pathlib
+import pytest
+import subprocess
+import sys
+import threading
 
 
 class TestGroupBySourceDir:
@@ -120,6 +126,347 @@ class TestIterBatches:
         ]
 
 
+class TestCopyFile:
+    """Test the _copy_file / _reflink helpers."""
+
+    def test_copies_content_and_mtime(self, tmp_path: pathlib.Path):
+        from undisorder.importer import _copy_file
+
+        src = tmp_path / "src.jpg"
+        src.write_bytes(b"content")
+        os.utime(src, (1_000_000, 1_000_000))
+        dst = tmp_path / "dst.jpg"
+
+        _copy_file(src, dst)
+        assert dst.read_bytes() == b"content"
+        assert dst.stat().st_mtime == 1_000_000
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="FICLONE is Linux only")
+    def test_clone_skips_data_copy(self, tmp_path: pathlib.Path):
+        from undisorder.importer import _copy_file
+
+        src = tmp_path / "src.jpg"
+        src.write_bytes(b"content")
+        dst = tmp_path / "dst.jpg"
+
+        with (
+            patch("undisorder.importer.fcntl.ioctl") as mock_ioctl,
+            patch("undisorder.importer.shutil.copy2") as mock_copy,
+        ):
+            _copy_file(src, dst)
+        mock_ioctl.assert_called_once()
+        mock_copy.assert_not_called()
+        assert dst.exists()
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="FICLONE is Linux only")
+    def test_clone_failure_falls_back(self, tmp_path: pathlib.Path):
+        from undisorder.importer import _reflink
+
+        src = tmp_path / "src.jpg"
+        src.write_bytes(b"content")
+        dst = tmp_path / "dst.jpg"
+
+        with patch("undisorder.importer.fcntl.ioctl", side_effect=OSError):
+            assert _reflink(src, dst) is False
+        assert not dst.exists()
+
+    def test_reflink_keeps_existing_target(self, tmp_path: pathlib.Path):
+        from undisorder.importer import _reflink
+
+        src = tmp_path / "src.jpg"
+        src.write_bytes(b"content")
+        dst = tmp_path / "dst.jpg"
+        dst.write_bytes(b"existing")
+
+        assert _reflink(src, dst) is False
+        assert dst.read_bytes() == b"existing"
+
+
+class TestMoveFile:
+    """Test the _move_file helper."""
+
+    def test_renames_on_same_filesystem(self, tmp_path: pathlib.Path):
+        from undisorder.importer import _move_file
+
+        src = tmp_path / "src.jpg"
+        src.write_bytes(b"content")
+        dst = tmp_path / "dst.jpg"
+
+        with patch("undisorder.importer.shutil.move") as mock_move:
+            _move_file(src, dst)
+        mock_move.assert_not_called()
+        assert not src.exists()
+        assert dst.read_bytes() == b"content"
+
+    def test_cross_device_falls_back(self, tmp_path: pathlib.Path):
+        from undisorder.importer import _move_file
+
+        import errno
+
+        src = tmp_path / "src.jpg"
+        src.write_bytes(b"content")
+        dst = tmp_path / "dst.jpg"
+
+        with patch(
+            "undisorder.importer.os.rename", side_effect=OSError(errno.EXDEV, "")
+        ):
+            _move_file(src, dst)
+        assert not src.exists()
+        assert dst.read_bytes() == b"content"
+
+
+class TestHashBatch:
+    """Test BaseImporter._hash_batch helper."""
+
+    def test_hashes_all_files(self, tmp_path: pathlib.Path, monkeypatch):
+        from undisorder.hasher import hash_file
+
+        monkeypatch.setenv("UNDISORDER_WORKERS", "4")
+        files = []
+        for i in range(5):
+            f = tmp_path / f"f{i}.jpg"
+            f.write_bytes(f"content {i}".encode())
+            files.append(f)
+
+        hashes = BaseImporter._hash_batch(files)
+        assert hashes == {f: hash_file(f) for f in files}
+
+    def test_sequential_with_single_worker(self, tmp_path: pathlib.Path, monkeypatch):
+        monkeypatch.setenv("UNDISORDER_WORKERS", "1")
+        f = tmp_path / "f.jpg"
+        f.write_bytes(b"content")
+
+        with patch("undisorder.hasher.ThreadPoolExecutor") as mock_pool:
+            hashes = BaseImporter._hash_batch([f, f])
+        mock_pool.assert_not_called()
+        assert list(hashes) == [f]
+
+    def test_error_propagates(self, tmp_path: pathlib.Path, monkeypatch):
+        monkeypatch.setenv("UNDISORDER_WORKERS", "2")
+        files = [tmp_path / "a.jpg", tmp_path / "missing.jpg"]
+        files[0].write_bytes(b"a")
+
+        with pytest.raises(FileNotFoundError):
+            BaseImporter._hash_batch(files)
+
+
+class TestCachedHashes:
+    """Test BaseImporter._cached_hashes persistent hash cache."""
+
+    def _make_importer(self, tmp_path: pathlib.Path):
+        from undisorder.importer import PhotoVideoImporter
+
+        args = MagicMock()
+        args.source = tmp_path / "source"
+        args.images_target = tmp_path / "photos"
+        args.video_target = tmp_path / "videos"
+        args.dry_run = False
+        return PhotoVideoImporter(args)
+
+    def test_unchanged_files_not_rehashed(self, tmp_path: pathlib.Path):
+        f = tmp_path / "a.jpg"
+        f.write_bytes(b"content")
+
+        with self._make_importer(tmp_path) as importer:
+            first = importer._cached_hashes([f])
+        with self._make_importer(tmp_path) as importer:
+            with patch("undisorder.hasher.hash_file") as mock_hash:
+                second = importer._cached_hashes([f])
+
+        mock_hash.assert_not_called()
+        assert first == second
+
+    def test_modified_file_rehashed(self, tmp_path: pathlib.Path):
+        f = tmp_path / "a.jpg"
+        f.write_bytes(b"content")
+
+        with self._make_importer(tmp_path) as importer:
+            first = importer._cached_hashes([f])
+            f.write_bytes(b"changed content")
+            second = importer._cached_hashes([f])
+
+        assert first != second
+
+
+class TestEnsureDir:
+    """Test BaseImporter._ensure_dir creating each directory once."""
+
+    def test_mkdir_once_per_directory(self, tmp_path: pathlib.Path):
+        importer = BaseImporter(MagicMock())
+        target = tmp_path / "a" / "b"
+        other = tmp_path / "a" / "c"
+
+        with patch.object(pathlib.Path, "mkdir", autospec=True) as mock_mkdir:
+            importer._ensure_dir(target)
+            importer._ensure_dir(target)
+            importer._ensure_dir(other)
+
+        assert [c.args[0] for c in mock_mkdir.call_args_list] == [target, other]
+
+
+class TestNamesIn:
+    """Test BaseImporter._names_in listing each target directory once."""
+
+    def test_listed_once_per_directory(self, tmp_path: pathlib.Path):
+        (tmp_path / "a.jpg").write_bytes(b"x")
+        importer = BaseImporter(MagicMock())
+        with patch("undisorder.importer.os.listdir", wraps=os.listdir) as mock_ls:
+            names = importer._names_in(tmp_path)
+            names.add("b.jpg")
+            assert importer._names_in(tmp_path) == {"a.jpg", "b.jpg"}
+        mock_ls.assert_called_once_with(tmp_path)
+
+    def test_missing_directory_is_empty(self, tmp_path: pathlib.Path):
+        importer = BaseImporter(MagicMock())
+        assert importer._names_in(tmp_path / "missing") == set()
+
+
+class TestLogProgress:
+    """Test per-file progress lines."""
+
+    def test_logged_at_info(self, caplog):
+        from undisorder.importer import _log_progress
+
+        with caplog.at_level(logging.INFO, logger="undisorder"):
+            _log_progress(2, 5, pathlib.Path("/x/a.jpg"), " \u2014 AcoustID ...")
+        assert "  [2/5] a.jpg \u2014 AcoustID ..." in caplog.text
+
+    def test_not_formatted_when_quiet(self, caplog):
+        from undisorder.importer import _log_progress
+
+        f = MagicMock()
+        name = PropertyMock(return_value="a.jpg")
+        type(f).name = name
+        with caplog.at_level(logging.WARNING, logger="undisorder"):
+            _log_progress(1, 1, f)
+        name.assert_not_called()
+        assert caplog.text == ""
+
+
+class TestLazyImports:
+    """The AcoustID/MusicBrainz stack is only imported for --identify."""
+
+    def test_cli_import_skips_musicbrainz(self):
+        src = pathlib.Path(__file__).parent.parent / "src"
+        code = "import sys, undisorder.cli; print('acoustid' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": str(src)}
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        assert out.stdout.strip() == "False"
+
+
+class TestClassifyMemo:
+    """Test PhotoVideoImporter routing photos and videos without re-classifying."""
+
+    def test_seeded_videos_not_classified(self, tmp_path: pathlib.Path):
+        from undisorder.importer import PhotoVideoImporter
+
+        args = MagicMock()
+        args.images_target = tmp_path / "photos"
+        args.video_target = tmp_path / "videos"
+        video = tmp_path / "clip.mp4"
+        photo = tmp_path / "a.jpg"
+        importer = PhotoVideoImporter(args, videos=[video])
+
+        with patch("undisorder.importer.classify", wraps=classify) as mock_classify:
+            assert importer._get_target_base(video) == args.video_target
+            assert importer._get_target_base(photo) == args.images_target
+            assert importer._get_target_base(photo) == args.images_target
+
+        mock_classify.assert_called_once_with(photo)
+
+
+class TestHashPipeline:
+    """Test BaseImporter.run hashing the next batch ahead of time."""
+
+    def _run(self, tmp_path: pathlib.Path, events: list[str]) -> int:
+        from undisorder.importer import PhotoVideoImporter
+
+        class RecordingImporter(PhotoVideoImporter):
+            def _start_hashing(self, batch, executor):
+                events.append(f"hash {batch[0].parent.name}")
+                return super()._start_hashing(batch, executor)
+
+            def _extract_metadata(self, batch):
+                events.append(f"extract {batch[0].parent.name}")
+                return super()._extract_metadata(batch)
+
+            def _finish_hashing(self, pending):
+                events.append("wait")
+                return super()._finish_hashing(pending)
+
+            def import_batch(self, batch, hashes=None):
+                events.append(f"import {batch[0].parent.name}")
+                assert hashes is not None
+                return super().import_batch(batch, hashes)
+
+        source = tmp_path / "source"
+        files = []
+        for name in ("aaa", "bbb"):
+            (source / name).mkdir(parents=True)
+            f = source / name / "photo.jpg"
+            f.write_bytes(f"content {name}".encode())
+            files.append(f)
+
+        args = MagicMock()
+        args.source = source
+        args.images_target = tmp_path / "photos"
+        args.video_target = tmp_path / "videos"
+        args.dry_run = False
+        args.move = False
+        with patch("undisorder.importer.extract_batch", return_value={}):
+            with RecordingImporter(args) as importer:
+                return importer.run(files)
+
+    def test_next_batch_hashed_before_current_import(self, tmp_path: pathlib.Path):
+        events: list[str] = []
+        failures = self._run(tmp_path, events)
+
+        assert failures == 0
+        assert events == [
+            "hash aaa",
+            "wait",
+            "hash bbb",
+            "import aaa",
+            "extract aaa",
+            "wait",
+            "import bbb",
+            "extract bbb",
+        ]
+
+    def test_prefetch_error_reported_for_own_batch(
+        self, tmp_path: pathlib.Path, monkeypatch
+    ):
+        monkeypatch.setattr("undisorder.importer.config_dir", lambda: tmp_path)
+        real_hash = __import__("undisorder.hasher", fromlist=["hash_file"]).hash_file
+
+        def failing_hash(path):
+            if "bbb" in str(path):
+                raise OSError("disk error")
+            return real_hash(path)
+
+        events: list[str] = []
+        with patch("undisorder.hasher.hash_file", side_effect=failing_hash):
+            failures = self._run(tmp_path, events)
+
+        assert failures == 1
+        assert events == [
+            "hash aaa",
+            "wait",
+            "hash bbb",
+            "import aaa",
+            "extract aaa",
+            "wait",
+        ]
+        entry = json.loads((tmp_path / "import_failures.jsonl").read_text())
+        assert entry["source_dir"] == "bbb"
+
+
 class TestImportPhotoVideo:
     """Test photo/video import functionality."""
 
@@ -248,6 +595,33 @@ class TestImportPhotoVideo:
         # Original should be removed (move mode)
         assert not (source / "photo.jpg").exists()
 
+    def test_import_move_forgets_cached_source_hashes(self, tmp_path: pathlib.Path):
+        from undisorder.hashdb import HashDB
+
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "a.jpg").write_bytes(b"\xff\xd8\xff\xd9move a")
+        (source / "b.jpg").write_bytes(b"\xff\xd8\xff\xd9move b")
+        (tmp_path / "photos").mkdir()
+        (tmp_path / "videos").mkdir()
+
+        args = MagicMock()
+        args.source = source
+        args.images_target = tmp_path / "photos"
+        args.video_target = tmp_path / "videos"
+        args.dry_run = False
+        args.move = True
+        args.exclude = []
+        args.exclude_dir = []
+        args.select = False
+
+        with patch("undisorder.importer.extract_batch", return_value={}):
+            run_import(args)
+
+        assert not (source / "a.jpg").exists()
+        db = HashDB(tmp_path / "photos")
+        assert db._conn.execute("SELECT * FROM hash_cache").fetchall() == []
+
     def test_import_skips_duplicates(self, tmp_path: pathlib.Path, caplog):
         source = tmp_path / "source"
         source.mkdir()
@@ -396,7 +770,7 @@ class TestBatchImport:
                     raise OSError("disk error")
                 return original_hash(path)
 
-            with patch("undisorder.importer.hash_file", side_effect=failing_hash):
+            with patch("undisorder.hasher.hash_file", side_effect=failing_hash):
                 with caplog.at_level(logging.INFO, logger="undisorder"):
                     run_import(args)
 
@@ -451,6 +825,143 @@ class TestBatchImport:
         ]
         assert len(found_files) == 1
 
+    def test_same_dir_dedup_within_batch(self, tmp_path: pathlib.Path, caplog):
+        """Same hash twice in one batch — imported once, batch does not fail."""
+        source = tmp_path / "source"
+        source.mkdir()
+        content = b"\xff\xd8\xff\xd9same content"
+        (source / "a.jpg").write_bytes(content)
+        (source / "b.jpg").write_bytes(content)
+
+        args = self._make_args(tmp_path)
+
+        with patch("undisorder.importer.extract_batch") as mock_extract:
+            mock_extract.return_value = {}
+            with caplog.at_level(logging.INFO, logger="undisorder"):
+                run_import(args)
+
+        found_files = [
+            f
+            for dirpath, _, files in os.walk(tmp_path / "photos")
+            for f in files
+            if not f.endswith(".db")
+        ]
+        assert found_files == ["a.jpg"]
+        assert "b.jpg (duplicate of a.jpg, skipping)" in caplog.text
+        assert "failed" not in caplog.text
+
+    def test_metadata_extracted_only_for_new_files(self, tmp_path: pathlib.Path):
+        """Duplicates and already-imported files never reach exiftool."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "a.jpg").write_bytes(b"\xff\xd8\xff\xd9first")
+        (source / "b.jpg").write_bytes(b"\xff\xd8\xff\xd9first")
+        args = self._make_args(tmp_path)
+
+        with patch("undisorder.importer.extract_batch", return_value={}) as mock_ex:
+            run_import(args)
+        mock_ex.assert_called_once_with([source / "a.jpg"])
+
+        (source / "c.jpg").write_bytes(b"\xff\xd8\xff\xd9second")
+        with patch("undisorder.importer.extract_batch", return_value={}) as mock_ex:
+            run_import(args)
+        mock_ex.assert_called_once_with([source / "c.jpg"])
+
+    def test_metadata_chunks_run_concurrently(
+        self, tmp_path: pathlib.Path, monkeypatch
+    ):
+        """One directory's photos are spread over several exiftool processes."""
+        monkeypatch.setenv("UNDISORDER_WORKERS", "2")
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "a.jpg").write_bytes(b"\xff\xd8\xff\xd9first")
+        (source / "b.jpg").write_bytes(b"\xff\xd8\xff\xd9second")
+        args = self._make_args(tmp_path)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_exiftool(chunk):
+            # both chunks must be in flight at the same time to pass
+            barrier.wait()
+            return [
+                {"SourceFile": str(p), "EXIF:DateTimeOriginal": "2021:07:04 10:00:00"}
+                for p in chunk
+            ]
+
+        with patch("undisorder.metadata._run_exiftool", side_effect=fake_exiftool):
+            run_import(args)
+
+        found = sorted(
+            pathlib.Path(dirpath, f).relative_to(tmp_path / "photos")
+            for dirpath, _, files in os.walk(tmp_path / "photos")
+            for f in files
+            if not f.endswith(".db")
+        )
+        assert [p.name for p in found] == ["a.jpg", "b.jpg"]
+        assert all(p.parts[0] == "2021" for p in found)
+
+    def test_copied_files_recorded_when_batch_fails(self, tmp_path: pathlib.Path):
+        """Files copied before a mid-batch error still get their DB rows."""
+        import shutil
+
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "a.jpg").write_bytes(b"\xff\xd8\xff\xd9first")
+        (source / "b.jpg").write_bytes(b"\xff\xd8\xff\xd9second")
+
+        args = self._make_args(tmp_path)
+
+        def failing_copy(src, dst):
+            if src.name == "b.jpg":
+                raise OSError("disk full")
+            shutil.copy2(src, dst)
+
+        with (
+            patch("undisorder.importer.extract_batch", return_value={}),
+            patch("undisorder.importer._copy_file", side_effect=failing_copy),
+        ):
+            run_import(args)
+
+        from undisorder.hashdb import HashDB
+        from undisorder.hasher import hash_file
+
+        db = HashDB(tmp_path / "photos")
+        assert db.hash_exists(hash_file(source / "a.jpg"))
+        assert not db.hash_exists(hash_file(source / "b.jpg"))
+        db.close()
+
+    def test_transfers_run_concurrently(self, tmp_path: pathlib.Path, monkeypatch):
+        """Copies overlap; a failed copy does not lose rows of finished ones."""
+        import shutil
+
+        monkeypatch.setenv("UNDISORDER_WORKERS", "2")
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "a.jpg").write_bytes(b"\xff\xd8\xff\xd9first")
+        (source / "b.jpg").write_bytes(b"\xff\xd8\xff\xd9second")
+        args = self._make_args(tmp_path)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def copy(src, dst):
+            # both copies must be in flight at the same time to pass
+            barrier.wait()
+            if src.name == "a.jpg":
+                raise OSError("disk full")
+            shutil.copy2(src, dst)
+
+        with (
+            patch("undisorder.importer.extract_batch", return_value={}),
+            patch("undisorder.importer._copy_file", side_effect=copy),
+        ):
+            run_import(args)
+
+        from undisorder.hashdb import HashDB
+        from undisorder.hasher import hash_file
+
+        db = HashDB(tmp_path / "photos")
+        assert not db.hash_exists(hash_file(source / "a.jpg"))
+        assert db.hash_exists(hash_file(source / "b.jpg"))
+        db.close()
+
     def test_dry_run_batch_shows_per_dir_output(self, tmp_path: pathlib.Path, caplog):
         """Dry run logs grouped by source dir."""
         source = tmp_path / "source"
@@ -693,6 +1204,24 @@ class TestImportAudio:
         assert call_kwargs.kwargs.get("file_hash") is not None
         assert call_kwargs.kwargs.get("db") is not None
 
+    def test_identify_skips_already_imported(self, tmp_path: pathlib.Path):
+        """Files already in the target are neither extracted nor identified."""
+        source = tmp_path / "source"
+        source.mkdir()
+        song = source / "song.mp3"
+        song.write_bytes(b"\xff\xfb\x90\x00imported before")
+
+        run_import(self._make_args(tmp_path))
+
+        args = self._make_args(tmp_path, identify=True, acoustid_key="test-key")
+        with (
+            patch("undisorder.importer.extract_audio_batch") as mock_extract,
+            patch("undisorder.importer.identify_audio") as mock_identify,
+        ):
+            run_import(args)
+        mock_extract.assert_not_called()
+        mock_identify.assert_not_called()
+
     def test_identify_writes_tags_and_updates_current_hash(
         self, tmp_path: pathlib.Path
     ):
@@ -725,10 +1254,10 @@ class TestImportAudio:
             ),
             patch("undisorder.importer.identify_audio", return_value=identified_meta),
             patch("undisorder.importer.write_audio_tags") as mock_write_tags,
-            patch("undisorder.importer.hash_file") as mock_hash,
+            # source hash, then the hash after the tag write
+            patch("undisorder.hasher.hash_file", return_value="original-hash"),
+            patch("undisorder.importer.hash_file", return_value="modified-hash"),
         ):
-            # First call: original hash, second call: hash after tag write
-            mock_hash.side_effect = ["original-hash", "modified-hash"]
             run_import(args)
 
         # write_audio_tags should have been called with the target path and metadata
@@ -837,6 +1366,47 @@ class TestImportAudio:
         mock_fp.assert_not_called()
         assert "cached" in caplog.text.lower()
 
+    def test_identify_runs_lookups_concurrently(
+        self, tmp_path: pathlib.Path, monkeypatch
+    ):
+        """Uncached lookups overlap; their cache rows are stored afterwards."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "a.mp3").write_bytes(b"\xff\xfb\x90\x00track a")
+        (source / "b.mp3").write_bytes(b"\xff\xfb\x90\x00track b")
+        monkeypatch.setenv("UNDISORDER_WORKERS", "4")
+
+        args = self._make_args(tmp_path, identify=True, acoustid_key="test-key")
+        meta_map = {
+            source / name: AudioMetadata(source_path=source / name)
+            for name in ("a.mp3", "b.mp3")
+        }
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_identify(path, meta, *, api_key, file_hash, db):
+            barrier.wait()
+            db.store_acoustid_cache(
+                file_hash=file_hash,
+                fingerprint="FP",
+                duration=1.0,
+                recording_id=None,
+                metadata={},
+            )
+            return meta
+
+        with (
+            patch("undisorder.importer.extract_audio_batch", return_value=meta_map),
+            patch("undisorder.importer.identify_audio", side_effect=fake_identify),
+        ):
+            run_import(args)
+
+        from undisorder.hashdb import HashDB
+        from undisorder.hasher import hash_file
+
+        with HashDB(tmp_path / "musik") as db:
+            for f in meta_map:
+                assert db.get_acoustid_cache(hash_file(f)) is not None
+
     def test_move_with_identify_deletes_source_after_success(
         self, tmp_path: pathlib.Path
     ):
@@ -1619,10 +2189,12 @@ class TestFailureLogging:
 
         rel_dir = pathlib.PurePosixPath("vacation")
         batch = [pathlib.Path("/src/vacation/photo1.jpg")]
+        importer = BaseImporter(MagicMock())
         try:
             raise OSError("disk read error")
         except OSError as exc:
-            BaseImporter._log_failure(rel_dir, "photo_video", batch, exc)
+            importer._log_failure(rel_dir, "photo_video", batch, exc)
+        importer.__exit__(None, None, None)
 
         log_path = config_dir / "import_failures.jsonl"
         assert log_path.exists()
@@ -1644,19 +2216,28 @@ class TestFailureLogging:
         config_dir.mkdir()
         monkeypatch.setattr("undisorder.importer.config_dir", lambda: config_dir)
 
-        for i in range(2):
-            try:
-                raise ValueError(f"error {i}")
-            except ValueError as exc:
-                BaseImporter._log_failure(
-                    pathlib.PurePosixPath(f"dir{i}"),
-                    "audio",
-                    [pathlib.Path(f"/src/dir{i}/file.mp3")],
-                    exc,
-                )
-
         log_path = config_dir / "import_failures.jsonl"
-        lines = log_path.read_text().strip().splitlines()
+        log_path.write_text('{"earlier": "run"}\n')
+
+        importer = BaseImporter(MagicMock())
+        with patch("builtins.open", wraps=open) as mock_open:
+            for i in range(2):
+                try:
+                    raise ValueError(f"error {i}")
+                except ValueError as exc:
+                    importer._log_failure(
+                        pathlib.PurePosixPath(f"dir{i}"),
+                        "audio",
+                        [pathlib.Path(f"/src/dir{i}/file.mp3")],
+                        exc,
+                    )
+                # each record is on disk right away
+                assert len(log_path.read_text().splitlines()) == i + 2
+        importer.__exit__(None, None, None)
+
+        # one handle is shared by all failures of a run
+        mock_open.assert_called_once()
+        lines = log_path.read_text().strip().splitlines()[1:]
         assert len(lines) == 2
 
         entries = [json.loads(line) for line in lines]
@@ -1669,15 +2250,17 @@ class TestFailureLogging:
         config_dir.mkdir()
         monkeypatch.setattr("undisorder.importer.config_dir", lambda: config_dir)
 
+        importer = BaseImporter(MagicMock())
         try:
             raise RuntimeError("something broke")
         except RuntimeError as exc:
-            BaseImporter._log_failure(
+            importer._log_failure(
                 pathlib.PurePosixPath("."),
                 "photo_video",
                 [pathlib.Path("/src/photo.jpg")],
                 exc,
             )
+        importer.__exit__(None, None, None)
 
         log_path = config_dir / "import_failures.jsonl"
         entry = json.loads(log_path.read_text().strip())
@@ -1723,7 +2306,7 @@ class TestFailureLogging:
             }
             # Make hash_file raise for all files
             with patch(
-                "undisorder.importer.hash_file", side_effect=OSError("disk error")
+                "undisorder.hasher.hash_file", side_effect=OSError("disk error")
             ):
                 with caplog.at_level(logging.WARNING, logger="undisorder"):
                     run_import(args)
@@ -1,11 +1,17 @@
 """Tests for undisorder.metadata — EXIF/metadata extraction via exiftool."""
 
+from undisorder.metadata import close_exiftool
 from undisorder.metadata import extract_batch
 from undisorder.metadata import Metadata
 from unittest.mock import patch
 
 import datetime
+import logging
+import os
 import pathlib
+import pytest
+import sys
+import threading
 
 
 def _make_exiftool_result(**overrides: object) -> dict[str, object]:
@@ -66,6 +72,37 @@ class TestExtractBatchDateParsing:
             results = extract_batch([path])
         assert results[path].date_taken is None
 
+    def test_impossible_date_falls_back_to_next_tag(self):
+        raw = [
+            _make_exiftool_result(
+                **{
+                    "EXIF:DateTimeOriginal": "2024:13:40 10:00:00",
+                    "EXIF:CreateDate": "2023:12:25 10:00:00",
+                }
+            )
+        ]
+        path = pathlib.Path("/fake/photo.jpg")
+        with patch("undisorder.metadata._run_exiftool", return_value=raw):
+            results = extract_batch([path])
+        assert results[path].date_taken == datetime.datetime(2023, 12, 25, 10, 0, 0)
+
+    def test_date_layout_matches_strptime(self):
+        from undisorder.metadata import _parse_date
+
+        fmt = "%Y:%m:%d %H:%M:%S"
+        for value in (
+            "2024:03:15 14:30:00",
+            "2024:3:5 4:07:09",
+            "2024:03:15 14:30:00+01:00",
+            "2024-03-15 14:30:00",
+            "2024:03:15",
+        ):
+            try:
+                expected = datetime.datetime.strptime(value, fmt)
+            except ValueError:
+                expected = None
+            assert _parse_date({"EXIF:DateTimeOriginal": value}) == expected, value
+
 
 class TestMtimeFallback:
     """Test filesystem mtime as date fallback when no EXIF date is found."""
@@ -124,6 +161,16 @@ class TestMtimeFallback:
         assert m.date_taken is not None
         assert m.date_from_mtime is True
 
+    def test_missing_file_has_no_date(self, tmp_path: pathlib.Path):
+        """No EXIF date and no file on disk → date stays None."""
+        photo = tmp_path / "gone.jpg"
+        raw = [_make_exiftool_result(SourceFile=str(photo))]
+        with patch("undisorder.metadata._run_exiftool", return_value=raw):
+            results = extract_batch([photo])
+        m = results[photo]
+        assert m.date_taken is None
+        assert m.date_from_mtime is False
+
 
 class TestExtractBatch:
     """Test batch metadata extraction."""
@@ -153,3 +200,126 @@ class TestExtractBatch:
     def test_empty_list(self):
         results = extract_batch([])
         assert results == {}
+
+    def test_chunks_run_concurrently(self, monkeypatch):
+        monkeypatch.setenv("UNDISORDER_WORKERS", "2")
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_exiftool(chunk):
+            # both chunks must be in flight at the same time to pass
+            barrier.wait()
+            return [
+                _make_exiftool_result(
+                    SourceFile=str(p),
+                    **{"EXIF:DateTimeOriginal": "2024:01:01 12:00:00"},
+                )
+                for p in chunk
+            ]
+
+        # well below batch_size, still spread over both workers
+        paths = [pathlib.Path(f"/fake/{i}.jpg") for i in range(4)]
+        with patch("undisorder.metadata._run_exiftool", side_effect=fake_exiftool):
+            results = extract_batch(paths)
+        assert list(results) == paths
+
+    def test_progress_logged_per_batch_size(self, monkeypatch, caplog):
+        monkeypatch.setenv("UNDISORDER_WORKERS", "4")
+        paths = [pathlib.Path(f"/fake/{i}.jpg") for i in range(8)]
+        with (
+            patch("undisorder.metadata._run_exiftool", return_value=[]) as mock_run,
+            caplog.at_level(logging.INFO, logger="undisorder"),
+        ):
+            extract_batch(paths, batch_size=4)
+        assert mock_run.call_count == 4
+        assert caplog.messages == [
+            "Extracting metadata ... 4/8",
+            "Extracting metadata ... 8/8",
+        ]
+
+    def test_single_worker_sequential(self, monkeypatch):
+        monkeypatch.setenv("UNDISORDER_WORKERS", "1")
+        paths = [pathlib.Path(f"/fake/{i}.jpg") for i in range(4)]
+        with (
+            patch("undisorder.metadata._run_exiftool", return_value=[]) as mock_run,
+            patch("undisorder.metadata.ThreadPoolExecutor") as mock_pool,
+        ):
+            extract_batch(paths, batch_size=2)
+        mock_pool.assert_not_called()
+        assert mock_run.call_count == 2
+
+
+_FAKE_EXIFTOOL = """\
+#!{python}
+import json
+import re
+import sys
+
+ESCAPES = dict(n="\\n", r="\\r")
+
+with open({log!r}, "a") as log:
+    log.write("start\\n")
+args = []
+for line in sys.stdin:
+    arg = line.rstrip("\\n").lstrip()
+    if arg.startswith("#[CSTR]"):
+        arg = re.sub(r"\\\\(.)", lambda m: ESCAPES.get(m[1], m[1]), arg[7:])
+    elif arg.startswith("#"):
+        continue
+    if arg == "-execute":
+        files = [a for a in args if not a.startswith("-")]
+        tag = "EXIF:DateTimeOriginal"
+        print(json.dumps([{{"SourceFile": f, tag: "2024:01:02 03:04:05"}} for f in files]))
+        print("{{ready}}", flush=True)
+        args = []
+    elif args[-1:] == ["-stay_open"] and arg == "False":
+        break
+    else:
+        args.append(arg)
+"""
+
+
+class TestExiftoolProcess:
+    """Test the persistent exiftool process behind extract_batch."""
+
+    @pytest.fixture
+    def fake_exiftool(self, tmp_path: pathlib.Path, monkeypatch):
+        log = tmp_path / "starts.log"
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        script = bin_dir / "exiftool"
+        script.write_text(_FAKE_EXIFTOOL.format(python=sys.executable, log=str(log)))
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        monkeypatch.setenv("UNDISORDER_WORKERS", "1")
+        yield log
+        close_exiftool()
+
+    def test_path_with_newline(self, fake_exiftool: pathlib.Path):
+        path = pathlib.Path("/fake/two\nlines\\.jpg")
+        results = extract_batch([path])
+        assert results[path].date_taken == datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+    def test_relative_paths(self, fake_exiftool: pathlib.Path, tmp_path, monkeypatch):
+        # would be a comment and lose its leading blank in the argfile
+        monkeypatch.chdir(tmp_path)
+        paths = [pathlib.Path("#tag.jpg"), pathlib.Path(" blank.jpg")]
+        results = extract_batch(paths)
+        assert list(results) == paths
+        assert all(m.date_taken is not None for m in results.values())
+
+    def test_process_reused_across_batches(self, fake_exiftool: pathlib.Path):
+        first = extract_batch([pathlib.Path("/fake/a.jpg")])
+        second = extract_batch(
+            [pathlib.Path("/fake/b.jpg"), pathlib.Path("/fake/c.jpg")]
+        )
+        assert first[pathlib.Path("/fake/a.jpg")].date_taken == datetime.datetime(
+            2024, 1, 2, 3, 4, 5
+        )
+        assert set(second) == {pathlib.Path("/fake/b.jpg"), pathlib.Path("/fake/c.jpg")}
+        assert fake_exiftool.read_text() == "start\n"
+
+    def test_close_exiftool_stops_process(self, fake_exiftool: pathlib.Path):
+        extract_batch([pathlib.Path("/fake/a.jpg")])
+        close_exiftool()
+        extract_batch([pathlib.Path("/fake/a.jpg")])
+        assert fake_exiftool.read_text() == "start\nstart\n"
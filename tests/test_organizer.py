@@ -7,6 +7,7 @@ from undisorder.organizer import determine_audio_target_path
 from undisorder.organizer import is_meaningful_dirname
 from undisorder.organizer import resolve_collision
 from undisorder.organizer import suggest_dirname
+from unittest.mock import patch
 
 import datetime
 import pathlib
@@ -102,6 +103,20 @@ class TestGetMeaningfulSourceDir:
         # No source_root → only checks "100APPLE" (not meaningful)
         assert _get_meaningful_source_dir(path) is None
 
+    def test_walk_cached_per_directory(self):
+        """Files in the same directory reuse the first walk."""
+        source_root = pathlib.Path("/cached")
+        parent = source_root / "Urlaub" / "DCIM"
+        with patch(
+            "undisorder.organizer.is_meaningful_dirname", wraps=is_meaningful_dirname
+        ) as mock_check:
+            for name in ("a.jpg", "b.jpg", "c.jpg"):
+                assert (
+                    _get_meaningful_source_dir(parent / name, source_root=source_root)
+                    == "Urlaub"
+                )
+        assert mock_check.call_count == 2
+
 
 class TestSuggestDirname:
     """Test directory name suggestion logic."""
@@ -164,6 +179,22 @@ class TestResolveCollision:
         assert result.suffix == ".mp4"
         assert result.stem == "video_1"
 
+    def test_taken_names_skip_stat(self, tmp_path: pathlib.Path):
+        taken = {"photo.jpg", "photo_1.jpg"}
+        with patch.object(pathlib.Path, "exists", return_value=False) as mock_exists:
+            result = resolve_collision(tmp_path / "photo.jpg", taken)
+        assert result == tmp_path / "photo_2.jpg"
+        # only the free candidate is checked on disk
+        assert mock_exists.call_count == 1
+        assert "photo_2.jpg" in taken
+
+    def test_taken_names_still_checked_on_disk(self, tmp_path: pathlib.Path):
+        (tmp_path / "photo.jpg").write_bytes(b"x")
+        taken: set[str] = set()
+        result = resolve_collision(tmp_path / "photo.jpg", taken)
+        assert result == tmp_path / "photo_1.jpg"
+        assert taken == {"photo_1.jpg"}
+
 
 class TestDetermineAudioTargetPath:
     """Test audio file target path determination."""
@@ -4,7 +4,9 @@ from undisorder.scanner import AUDIO_EXTENSIONS
 from undisorder.scanner import classify
 from undisorder.scanner import FileType
 from undisorder.scanner import scan
+from unittest.mock import patch
 
+import os
 import pathlib
 
 
@@ -203,3 +205,48 @@ class TestScan:
         (tmp_source / "c.txt").write_text("x")
         result = scan(tmp_source)
         assert result.total == 3
+
+    def test_results_sorted_by_path(self, tmp_source: pathlib.Path):
+        for name in ("b/z.jpg", "a/y.jpg", "c.jpg", "a/x.jpg"):
+            f = tmp_source / name
+            f.parent.mkdir(exist_ok=True)
+            f.write_bytes(b"\xff\xd8\xff\xd9")
+        result = scan(tmp_source)
+        assert result.photos == sorted(result.photos)
+        assert len(result.photos) == 4
+
+    def test_does_not_follow_symlinked_directories(
+        self, tmp_source: pathlib.Path, tmp_path: pathlib.Path
+    ):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "a.jpg").write_bytes(b"\xff\xd8\xff\xd9")
+        (tmp_source / "link").symlink_to(outside)
+        result = scan(tmp_source)
+        assert result.photos == []
+
+    def test_does_not_stat_paths(self, tmp_source: pathlib.Path):
+        """File types come from scandir, not from one stat() per path."""
+        sub = tmp_source / "sub"
+        sub.mkdir()
+        (sub / "a.jpg").write_bytes(b"\xff\xd8\xff\xd9")
+        with patch.object(pathlib.Path, "is_file") as mock_is_file:
+            result = scan(tmp_source)
+        mock_is_file.assert_not_called()
+        assert result.photos == [sub / "a.jpg"]
+
+    def test_skips_unreadable_directories(self, tmp_source: pathlib.Path):
+        locked = tmp_source / "lost+found"
+        locked.mkdir()
+        (locked / "a.jpg").write_bytes(b"\xff\xd8\xff\xd9")
+        (tmp_source / "b.jpg").write_bytes(b"\xff\xd8\xff\xd9")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if pathlib.Path(path) == locked:
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        with patch("os.scandir", side_effect=scandir):
+            result = scan(tmp_source)
+        assert result.photos == [tmp_source / "b.jpg"]